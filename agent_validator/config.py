@@ -1,7 +1,9 @@
 """Configuration management for agent_validator."""
 
+import functools
 import os
 from pathlib import Path
+from typing import Any
 
 try:
     import tomllib
@@ -10,6 +12,41 @@ except ImportError:
 
 from .typing_ import Config
 
+_FILE_KEYS = (
+    "max_output_bytes",
+    "max_str_len",
+    "max_list_len",
+    "max_dict_keys",
+    "log_to_cloud",
+    "cloud_endpoint",
+    "license_key",
+    "webhook_secret",
+    "timeout_s",
+    "retries",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_file(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Parse the config file, cached on its path and stat signature.
+
+    Args:
+        path: Path to the config file
+        mtime_ns: Modification time of the file, used as part of the cache key
+        size: Size of the file, used as part of the cache key
+
+    Returns:
+        Known settings from the file, or an empty dict if it cannot be parsed
+    """
+    try:
+        with open(path, "rb") as f:
+            file_config = tomllib.load(f)
+    except Exception:
+        # Ignore config file errors
+        return {}
+    return {key: file_config[key] for key in _FILE_KEYS if key in file_config}
+
 
 def get_config() -> Config:
     """
@@ -23,35 +60,16 @@ def get_config() -> Config:
 
     # Load from config file
     config_file = Path.home() / ".agent_validator" / "config.toml"
-    if config_file.exists():
-        try:
-            with open(config_file, "rb") as f:
-                file_config = tomllib.load(f)
-
-            # Update config with file values
-            if "max_output_bytes" in file_config:
-                config.max_output_bytes = file_config["max_output_bytes"]
-            if "max_str_len" in file_config:
-                config.max_str_len = file_config["max_str_len"]
-            if "max_list_len" in file_config:
-                config.max_list_len = file_config["max_list_len"]
-            if "max_dict_keys" in file_config:
-                config.max_dict_keys = file_config["max_dict_keys"]
-            if "log_to_cloud" in file_config:
-                config.log_to_cloud = file_config["log_to_cloud"]
-            if "cloud_endpoint" in file_config:
-                config.cloud_endpoint = file_config["cloud_endpoint"]
-            if "license_key" in file_config:
-                config.license_key = file_config["license_key"]
-            if "webhook_secret" in file_config:
-                config.webhook_secret = file_config["webhook_secret"]
-            if "timeout_s" in file_config:
-                config.timeout_s = file_config["timeout_s"]
-            if "retries" in file_config:
-                config.retries = file_config["retries"]
-        except Exception:
-            # Ignore config file errors
-            pass
+    try:
+        stat = config_file.stat()
+    except OSError:
+        pass
+    else:
+        file_config = _load_config_file(
+            str(config_file), stat.st_mtime_ns, stat.st_size
+        )
+        for key, value in file_config.items():
+            setattr(config, key, value)
 
     # Override with environment variables
     if "AGENT_VALIDATOR_MAX_OUTPUT_BYTES" in os.environ:
@@ -153,6 +171,8 @@ def save_config(config: Config) -> None:
             else:
                 f.write(f"{key} = {value}\n")
 
+    _load_config_file.cache_clear()
+
 
 def create_default_config() -> None:
     """Create default configuration file if it doesn't exist."""
@@ -0,0 +1,130 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+import re
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+JSONDecodeError = json.JSONDecodeError
+
+# orjson parses integers outside the 64-bit range as floats; the shortest that
+# can overflow has 19 digits
+_LONG_DIGIT_RUN = re.compile("[0-9]{19}")
+_LONG_DIGIT_RUN_BYTES = re.compile(b"[0-9]{19}")
+
+# Datetimes, dataclasses, non-string keys and subclasses of builtins go to the
+# stdlib, which decides whether and how they are encoded
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _has_float_orjson_writes_differently(obj: Any) -> bool:
+    """
+    Check for floats orjson doesn't write the way the stdlib does.
+
+    orjson writes NaN and infinities as ``null`` and uses its own exponent
+    notation, while ``float.__repr__`` switches to ``1e+16``/``1e-05`` style
+    outside ``1e-4 <= abs(x) < 1e16``. Other floats come out identically.
+
+    Args:
+        obj: Value orjson has already serialized, so it holds no cycles
+
+    Returns:
+        True if the value contains such a float
+    """
+    stack: list[Any] = [(obj,)]
+    while stack:
+        value = stack.pop()
+        for item in value.values() if type(value) is dict else value:
+            item_type = type(item)
+            if item_type is float:
+                # NaN fails every comparison, so it lands here too
+                if item != 0.0 and not 1e-4 <= abs(item) < 1e16:
+                    return True
+            elif item_type is dict or item_type is list or item_type is tuple:
+                stack.append(item)
+    return False
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text as str or UTF-8 bytes
+
+    Returns:
+        The parsed value
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        if isinstance(data, str):
+            has_long_int = _LONG_DIGIT_RUN.search(data) is not None
+        else:
+            has_long_int = _LONG_DIGIT_RUN_BYTES.search(data) is not None
+        if not has_long_int:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # The stdlib also accepts NaN/Infinity
+                pass
+    return json.loads(data)
+
+
+def dumpb(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize a value to UTF-8 encoded JSON.
+
+    Both backends produce the same bytes: compact separators (or two-space
+    indentation), unescaped non-ASCII and ``float.__repr__`` number formatting,
+    including ``NaN``/``Infinity``. Values the stdlib can't encode raise
+    TypeError, except that orjson also accepts UUIDs and enums.
+
+    Args:
+        obj: Value to serialize
+        indent: Whether to pretty-print with two-space indentation
+
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        option = _ORJSON_OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            serialized = orjson.dumps(obj, option=option)
+        except TypeError:
+            # Let the stdlib handle (or reject) values orjson doesn't support
+            pass
+        else:
+            if not _has_float_orjson_writes_differently(obj):
+                return serialized
+
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize a value to a JSON string.
+
+    Args:
+        obj: Value to serialize
+        indent: Whether to pretty-print with two-space indentation
+
+    Returns:
+        The JSON document
+    """
+    return dumpb(obj, indent).decode()
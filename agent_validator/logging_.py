@@ -1,12 +1,11 @@
 """Logging utilities for validation results."""
 
+import functools
 import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-import requests
-
 from .config import get_config
 from .errors import CloudLogError
 from .redact import redact_sensitive_data
@@ -90,6 +89,14 @@ def _log_locally(log_entry: dict[str, Any]) -> None:
         f.write(json.dumps(log_entry) + "\n")
 
 
+@functools.cache
+def _get_session() -> Any:
+    """Return the HTTP session shared by all cloud log requests."""
+    import requests
+
+    return requests.Session()
+
+
 def _log_to_cloud(log_entry: dict[str, Any], config: Any) -> None:
     """Log entry to cloud service."""
     if not config.license_key:
@@ -126,9 +133,11 @@ def _log_to_cloud(log_entry: dict[str, Any], config: Any) -> None:
         ).hexdigest()
         headers["x-signature"] = signature
 
+    import requests
+
     # Send request
     try:
-        response = requests.post(
+        response = _get_session().post(
             f"{config.cloud_endpoint}/logs",
             data=payload,
             headers=headers,
@@ -1,8 +1,42 @@
 """Redaction utilities for sensitive data."""
 
+import functools
 import re
+import string
+import threading
 from typing import Any, Optional
 
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None  # type: ignore[assignment]
+
+_FLAGS = re.IGNORECASE | re.MULTILINE
+
+
+class _NonDigitDeleteTable(dict[int, Optional[int]]):
+    """
+    ``str.translate`` table that deletes every non-digit character.
+
+    Entries for characters outside Latin-1 are filled in on first use, so the
+    table matches ``re``'s ``\\D`` without enumerating all of Unicode upfront.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = codepoint if chr(codepoint).isdecimal() else None
+        self[codepoint] = value
+        return value
+
+
+_NON_DIGIT_DELETE = _NonDigitDeleteTable(
+    (c, c if chr(c).isdecimal() else None) for c in range(256)
+)
+
 # Default redaction patterns
 DEFAULT_PATTERNS = {
     "license_key": r"(?i)(license[_-]?key|licensekey)[\s]*[:=][\s]*['\"]?([a-zA-Z0-9_-]{20,})['\"]?",
@@ -20,6 +54,350 @@ DEFAULT_PATTERNS = {
     "secret": r"(?i)(secret|key)[\s]*[:=][\s]*['\"]?([a-zA-Z0-9_-]{20,})['\"]?",
 }
 
+# Placeholder for values nested deeper than redact_dict's max_depth
+_MAX_DEPTH_MARKER = "[REDACTED - MAX DEPTH]"
+
+# Patterns whose whole match is replaced with [REDACTED]
+_FULL_REDACTION_PATTERNS = frozenset(
+    {
+        "license_key",
+        "license_key_value",
+        "api_key",
+        "jwt",
+        "jwt_value",
+        "password",
+        "password_value",
+        "secret",
+        "phone",
+    }
+)
+
+# Lowercase literals, one of which must occur in the text for a default pattern
+# to match. An empty tuple marks patterns that need a digit instead. Patterns
+# without an entry (phone_value, custom patterns) always run.
+_PATTERN_TRIGGERS: dict[str, tuple[str, ...]] = {
+    "license_key": ("license",),
+    "license_key_value": ("license-",),
+    "api_key": ("api",),
+    "jwt": ("bearer", "jwt", "token"),
+    "jwt_value": ("bearer",),
+    "email": ("@",),
+    "phone": ("phone", "tel", "mobile"),
+    "ssn": (),
+    "credit_card": (),
+    "password": ("password", "passwd", "pwd"),
+    "password_value": (),
+    "secret": ("secret", "key"),
+}
+
+_DIGIT = re.compile(r"\d")
+
+
+# ASCII whitespace as matched by ``re``'s ``\s``; RE2's omits \x0b and \x1c-\x1f
+_RE_WHITESPACE = r"\t\n\x0b\f\r\x1c-\x1f "
+
+
+def _spell_out_whitespace(pattern: str) -> str:
+    """
+    Replace ``\\s`` and ``\\S`` with explicit ``re`` ASCII whitespace classes.
+
+    Args:
+        pattern: Regex pattern
+
+    Returns:
+        Pattern that matches the same ASCII whitespace in any engine
+
+    Raises:
+        ValueError: If ``\\S`` appears inside a character class
+    """
+    parts = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escape = pattern[i : i + 2]
+            if escape == r"\s":
+                escape = _RE_WHITESPACE if in_class else f"[{_RE_WHITESPACE}]"
+            elif escape == r"\S":
+                if in_class:
+                    raise ValueError("\\S inside a character class")
+                escape = f"[^{_RE_WHITESPACE}]"
+            parts.append(escape)
+            i += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        parts.append(char)
+        i += 1
+    return "".join(parts)
+
+
+class _AsciiRE2Pattern:
+    """
+    RE2 pattern for ASCII text, backed by ``re`` for everything else.
+
+    RE2's ``\\d``, ``\\b`` and case folding are ASCII-only while ``re``'s are
+    Unicode-aware, so RE2 only sees text on which both engines agree.
+    """
+
+    __slots__ = ("_re2", "_re")
+
+    def __init__(self, re2_pattern: Any, re_pattern: re.Pattern[str]) -> None:
+        self._re2 = re2_pattern
+        self._re = re_pattern
+
+    def sub(self, repl: Any, text: str) -> str:
+        """Substitute matches using the engine suited to the text."""
+        return (self._re2 if text.isascii() else self._re).sub(repl, text)
+
+    def search(self, text: str) -> Any:
+        """Search using the engine suited to the text."""
+        return (self._re2 if text.isascii() else self._re).search(text)
+
+
+def _compile_pattern(pattern: str) -> Any:
+    """
+    Compile a redaction pattern.
+
+    RE2 is used for ASCII text when installed since it matches in linear time
+    and cannot backtrack catastrophically. Non-ASCII text and patterns RE2
+    does not support (e.g. lookaheads) use the stdlib ``re`` engine.
+
+    Args:
+        pattern: Regex pattern
+
+    Returns:
+        Compiled pattern object exposing ``sub``
+    """
+    compiled = re.compile(pattern, _FLAGS)
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = False
+        options.log_errors = False
+        try:
+            ascii_pattern = re2.compile(
+                "(?m)" + _spell_out_whitespace(pattern), options
+            )
+        except (ValueError, re2.error):
+            pass
+        else:
+            return _AsciiRE2Pattern(ascii_pattern, compiled)
+
+    return compiled
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_custom_patterns(patterns: tuple[tuple[str, str], ...]) -> dict[str, Any]:
+    """Compile custom patterns, caching the result for repeated pattern sets."""
+    return {name: _compile_pattern(pattern) for name, pattern in patterns}
+
+
+class _LicenseValueMatcher:
+    """
+    Literal-prefix replacement for the default ``license_key_value`` pattern.
+
+    Finds ``license-`` with ``str.find`` and extends over the token characters,
+    which avoids a full regex pass over the text for a fixed prefix. Non-ASCII
+    text goes through the regex.
+    """
+
+    prefix = "license-"
+    token_chars = frozenset(string.ascii_letters + string.digits + "_-")
+
+    def __init__(self) -> None:
+        self._fallback = re.compile(DEFAULT_PATTERNS["license_key_value"], _FLAGS)
+
+    def sub(self, repl: str, text: str) -> str:
+        """Replace every ``license-<token>`` occurrence with ``repl``."""
+        if not text.isascii():
+            # re.IGNORECASE also matches e.g. the Kelvin sign against "k"
+            return self._fallback.sub(repl, text)
+
+        lowered = text.lower()
+        start = lowered.find(self.prefix)
+        if start == -1:
+            return text
+
+        token_chars = self.token_chars
+        size = len(text)
+        parts = []
+        pos = 0
+        while start != -1:
+            token_start = start + len(self.prefix)
+            end = token_start
+            while end < size and text[end] in token_chars:
+                end += 1
+
+            if end == token_start:
+                # Prefix without a token, keep looking past it
+                start = lowered.find(self.prefix, start + 1)
+                continue
+
+            parts.append(text[pos:start])
+            parts.append(repl)
+            pos = end
+            start = lowered.find(self.prefix, end)
+
+        parts.append(text[pos:])
+        return "".join(parts)
+
+
+# Default patterns that all require "<keyword>\\s*[:=]" somewhere in a match
+_ASSIGNMENT_PATTERNS = frozenset({"license_key", "jwt", "password", "secret", "phone"})
+
+
+@functools.cache
+def _assignment_prefilter() -> Any:
+    """
+    Fuse the keywords of the assignment patterns into a single prefilter.
+
+    Returns:
+        A compiled RE2 pattern, or None when RE2 is unavailable. Python's
+        backtracking engine runs the fused alternation no faster than the
+        individual patterns, so it isn't worth a separate pass there.
+    """
+    if re2 is None:
+        return None
+
+    prefilter = _compile_pattern(
+        r"(?:bearer|jwt|token|password|passwd|pwd|secret|key|phone|tel|mobile)"
+        r"\s*[:=]"
+    )
+    return prefilter if isinstance(prefilter, _AsciiRE2Pattern) else None
+
+
+def _has_keyword_assignment(text: str) -> bool:
+    """Check whether any assignment pattern could match the text."""
+    if ":" not in text and "=" not in text:
+        return False
+    prefilter = _assignment_prefilter()
+    if prefilter is None:
+        return True
+    return prefilter.search(text) is not None
+
+
+# Default patterns Hyperscan can't compile (lookarounds) always run
+_HYPERSCAN_NAMES = tuple(name for name in DEFAULT_PATTERNS if name != "password_value")
+
+
+def _hyperscan_expression(pattern: str) -> bytes:
+    """
+    Translate a default pattern into a Hyperscan expression.
+
+    The leading inline flag is dropped since the database is compiled
+    caseless, and ``\\s`` is spelled out as ``re``'s whitespace set, so
+    Hyperscan agrees with both engines on ASCII text.
+
+    Args:
+        pattern: Regex pattern from DEFAULT_PATTERNS
+
+    Returns:
+        Expression bytes for ``hyperscan.Database.compile``
+    """
+    return _spell_out_whitespace(pattern.removeprefix("(?i)")).encode()
+
+
+@functools.cache
+def _hyperscan_database() -> Any:
+    """Compile the default patterns into one Hyperscan database, or None."""
+    if hyperscan is not None:
+        expressions = [
+            _hyperscan_expression(DEFAULT_PATTERNS[name]) for name in _HYPERSCAN_NAMES
+        ]
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=hyperscan.HS_FLAG_CASELESS
+                | hyperscan.HS_FLAG_MULTILINE
+                | hyperscan.HS_FLAG_SINGLEMATCH,
+            )
+            return database
+        except hyperscan.error:
+            pass
+
+    return None
+
+
+# Hyperscan scratch space can't be shared between concurrent scans
+_hyperscan_local = threading.local()
+
+
+def _hyperscan_matches(text: str) -> frozenset[str]:
+    """Return the names of default patterns with a match in ASCII text."""
+    database = _hyperscan_database()
+    scratch = getattr(_hyperscan_local, "scratch", None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(database)
+
+    found: set[str] = set()
+
+    def on_match(
+        pattern_id: int, start: int, end: int, flags: int, context: Any
+    ) -> None:
+        found.add(_HYPERSCAN_NAMES[pattern_id])
+
+    database.scan(text.encode("ascii"), match_event_handler=on_match, scratch=scratch)
+    return frozenset(found)
+
+
+class _HyperscanScan:
+    """
+    Lazily computed set of default patterns that match the current text.
+
+    The scan is redone only after a substitution actually changes the text.
+    """
+
+    __slots__ = ("text", "_found")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._found: Optional[frozenset[str]] = None
+
+    def update(self, text: str) -> None:
+        """Record the text after a substitution."""
+        if text != self.text:
+            self.text = text
+            self._found = None
+
+    def may_match(self, name: str) -> bool:
+        """Check whether the named default pattern matches the text."""
+        if self._found is None:
+            self._found = _hyperscan_matches(self.text)
+        return name in self._found
+
+
+def _last_four_digits(text: str) -> Optional[str]:
+    """
+    Return the last four digits of a match, or None if it has fewer.
+
+    Default SSN, card and phone matches end in four digits, which are sliced
+    off directly; anything else has its non-digits stripped first.
+    """
+    tail = text[-4:]
+    if len(tail) == 4 and tail.isdecimal():
+        return tail
+
+    digits = text.translate(_NON_DIGIT_DELETE)
+    if len(digits) < 4:
+        return None
+    return digits[-4:]
+
+
+@functools.cache
+def _default_compiled_patterns() -> dict[str, Any]:
+    """Compile the default patterns on first use; shared by every Redactor."""
+    compiled = {
+        name: _compile_pattern(pattern) for name, pattern in DEFAULT_PATTERNS.items()
+    }
+    compiled["license_key_value"] = _LicenseValueMatcher()
+    return compiled
+
 
 class Redactor:
     """Redactor for sensitive data patterns."""
@@ -31,16 +409,21 @@ class Redactor:
         Args:
             patterns: Dictionary of pattern_name -> regex_pattern
         """
+        self.patterns = DEFAULT_PATTERNS.copy()
+        self.compiled_patterns = _default_compiled_patterns().copy()
+
         if patterns:
             # Merge custom patterns with default patterns
-            self.patterns = DEFAULT_PATTERNS.copy()
             self.patterns.update(patterns)
-        else:
-            self.patterns = DEFAULT_PATTERNS.copy()
+            self.compiled_patterns.update(
+                _compile_custom_patterns(tuple(patterns.items()))
+            )
 
-        self.compiled_patterns = {
-            name: re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-            for name, pattern in self.patterns.items()
+        # Trigger literals only hold for the default patterns
+        self._triggers = {
+            name: triggers
+            for name, triggers in _PATTERN_TRIGGERS.items()
+            if not patterns or name not in patterns
         }
 
     def redact_text(self, text: str) -> str:
@@ -55,122 +438,207 @@ class Redactor:
         """
 
         redacted = text
+        compiled = self.compiled_patterns
 
-        # Process patterns in a specific order to avoid conflicts
-        # Start with specific patterns first
-        if "email" in self.compiled_patterns:
-            redacted = self.compiled_patterns["email"].sub(
-                lambda m: self._redact_email(m.group(0)), redacted
-            )
-
-        if "phone_value" in self.compiled_patterns:
-            redacted = self.compiled_patterns["phone_value"].sub(
-                lambda m: self._redact_phone(m.group(0)), redacted
-            )
+        # Skip patterns whose trigger literals are absent from the text. Case
+        # folding only agrees with re.IGNORECASE on ASCII (e.g. "İ" matches
+        # "i"), so other text runs every pattern.
+        folded = text.lower() if text.isascii() else None
+        has_digit = _DIGIT.search(text) is not None
 
-        if "ssn" in self.compiled_patterns:
-            redacted = self.compiled_patterns["ssn"].sub(
-                lambda m: self._redact_ssn(m.group(0)), redacted
-            )
+        # With Hyperscan, one pass finds which default patterns match at all.
+        # Only ASCII text is scanned, where its semantics agree with re's.
+        scan = None
+        if text.isascii() and _hyperscan_database() is not None:
+            scan = _HyperscanScan(text)
 
-        if "credit_card" in self.compiled_patterns:
-            redacted = self.compiled_patterns["credit_card"].sub(
-                lambda m: self._redact_credit_card(m.group(0)), redacted
-            )
+        # Process patterns in a specific order to avoid conflicts
+        # Start with specific patterns first
+        if "email" in compiled and self._can_match("email", folded, has_digit, scan):
+            redacted = compiled["email"].sub(self._redact_email, redacted)
+            if scan is not None:
+                scan.update(redacted)
+
+        if "phone_value" in compiled and self._can_match(
+            "phone_value", folded, has_digit, scan
+        ):
+            redacted = compiled["phone_value"].sub(self._redact_phone, redacted)
+            if scan is not None:
+                scan.update(redacted)
+
+        if "ssn" in compiled and self._can_match("ssn", folded, has_digit, scan):
+            redacted = compiled["ssn"].sub(self._redact_ssn, redacted)
+            if scan is not None:
+                scan.update(redacted)
+
+        if "credit_card" in compiled and self._can_match(
+            "credit_card", folded, has_digit, scan
+        ):
+            redacted = compiled["credit_card"].sub(self._redact_credit_card, redacted)
+            if scan is not None:
+                scan.update(redacted)
 
         # Then process general patterns
-        for pattern_name, pattern in self.compiled_patterns.items():
-            if pattern_name in [
-                "license_key",
-                "license_key_value",
-                "api_key",
-                "jwt",
-                "jwt_value",
-                "password",
-                "password_value",
-                "secret",
-                "phone",
-            ] or pattern_name.startswith("custom_"):
+        has_assignment: Optional[bool] = None
+        for pattern_name, pattern in compiled.items():
+            if (
+                pattern_name in _FULL_REDACTION_PATTERNS
+                or pattern_name.startswith("custom_")
+            ) and self._can_match(pattern_name, folded, has_digit, scan):
+                if (
+                    pattern_name in _ASSIGNMENT_PATTERNS
+                    and pattern_name in self._triggers
+                ):
+                    # One shared pass decides whether any "<keyword> = value"
+                    # pattern can match. "[REDACTED]" never introduces a new
+                    # keyword or separator, so the answer holds for the loop.
+                    if has_assignment is None:
+                        has_assignment = _has_keyword_assignment(redacted)
+                    if not has_assignment:
+                        continue
+
                 # Replace the entire match
                 redacted = pattern.sub("[REDACTED]", redacted)
+                if scan is not None:
+                    scan.update(redacted)
 
         return redacted
 
+    def _can_match(
+        self,
+        name: str,
+        folded: Optional[str],
+        has_digit: bool,
+        scan: Optional[_HyperscanScan] = None,
+    ) -> bool:
+        """Check whether a pattern's trigger literals occur in the text."""
+        triggers = self._triggers.get(name)
+        if triggers is not None:
+            if not triggers:
+                if not has_digit:
+                    return False
+            elif folded is not None and not any(
+                trigger in folded for trigger in triggers
+            ):
+                return False
+
+        if (
+            scan is not None
+            and name in _HYPERSCAN_NAMES
+            and self.compiled_patterns[name] is _default_compiled_patterns()[name]
+        ):
+            return scan.may_match(name)
+        return True
+
     def redact_dict(self, data: Any, max_depth: int = 10) -> Any:
         """
-        Recursively redact sensitive data from dictionary or other data structures.
+        Redact sensitive data from dictionary or other data structures.
+
+        Containers are walked iteratively with an explicit stack and copied, so
+        the input is never mutated. Only strings are passed through the
+        patterns; other leaves are returned by reference.
 
         Args:
             data: Data to redact
-            max_depth: Maximum recursion depth
+            max_depth: Maximum nesting depth
 
         Returns:
             Redacted data
         """
         if max_depth <= 0:
-            return "[REDACTED - MAX DEPTH]"
+            return _MAX_DEPTH_MARKER
+
+        if isinstance(data, str):
+            return self.redact_text(data)
 
         if isinstance(data, dict):
-            result = {}
-            for key, value in data.items():
-                # Special handling for password fields
-                if isinstance(value, str) and "password" in key.lower():
-                    if "password_value" in self.compiled_patterns:
-                        result[key] = self.compiled_patterns["password_value"].sub(
-                            "[REDACTED]", value
-                        )
-                    else:
-                        result[key] = self.redact_dict(value, max_depth - 1)
-                else:
-                    result[key] = self.redact_dict(value, max_depth - 1)
-            return result
+            result: Any = {}
         elif isinstance(data, list):
-            return [self.redact_dict(item, max_depth - 1) for item in data]
-        elif isinstance(data, str):
-            return self.redact_text(data)
+            result = [None] * len(data)
         else:
             # For any other type (int, float, bool, etc.), return as-is
             return data
 
-    def _redact_email(self, email: str) -> str:
-        """Redact email address."""
-        if "@" not in email:
+        redact_text = self.redact_text
+        password_pattern = self.compiled_patterns.get("password_value")
+
+        # Each entry holds a source container, its copy, and the depth budget
+        # left for the container's children
+        stack = [(data, result, max_depth - 1)]
+        while stack:
+            source, target, depth = stack.pop()
+            items = source.items() if isinstance(source, dict) else enumerate(source)
+
+            for key, value in items:
+                if isinstance(value, str):
+                    # Special handling for password fields
+                    if (
+                        isinstance(key, str)
+                        and password_pattern is not None
+                        and "password" in key.lower()
+                    ):
+                        target[key] = password_pattern.sub("[REDACTED]", value)
+                    elif depth <= 0:
+                        target[key] = _MAX_DEPTH_MARKER
+                    else:
+                        target[key] = redact_text(value)
+                elif depth <= 0:
+                    target[key] = _MAX_DEPTH_MARKER
+                elif isinstance(value, dict):
+                    child: Any = {}
+                    target[key] = child
+                    stack.append((value, child, depth - 1))
+                elif isinstance(value, list):
+                    child = [None] * len(value)
+                    target[key] = child
+                    stack.append((value, child, depth - 1))
+                else:
+                    target[key] = value
+
+        return result
+
+    def _redact_email(self, match: Any) -> str:
+        """Redact an email address match."""
+        email: str = match.group(0)
+        at = email.find("@")
+        if at == -1:
             return "[REDACTED]"
 
-        username, domain = email.split("@", 1)
-        if len(username) <= 2:
-            redacted_username = "*" * len(username)
+        if at <= 2:
+            redacted_username = "*" * at
         else:
-            redacted_username = username[0] + "***" + username[-1]
+            redacted_username = email[0] + "***" + email[at - 1]
 
-        return f"{redacted_username}@{domain}"
+        return f"{redacted_username}{email[at:]}"
 
-    def _redact_phone(self, phone: str) -> str:
-        """Redact phone number."""
-        digits = re.sub(r"\D", "", phone)
-        if len(digits) < 4:
+    def _redact_phone(self, match: Any) -> str:
+        """Redact a phone number match."""
+        last_four = _last_four_digits(match.group(0))
+        if last_four is None:
             return "[REDACTED]"
 
-        return f"***-***-{digits[-4:]}"
+        return f"***-***-{last_four}"
 
-    def _redact_ssn(self, ssn: str) -> str:
-        """Redact social security number."""
-        digits = re.sub(r"\D", "", ssn)
-        if len(digits) < 4:
+    def _redact_ssn(self, match: Any) -> str:
+        """Redact a social security number match."""
+        last_four = _last_four_digits(match.group(0))
+        if last_four is None:
             return "[REDACTED]"
-        return "***-**-" + digits[-4:]
+        return "***-**-" + last_four
 
-    def _redact_credit_card(self, card: str) -> str:
-        """Redact credit card number."""
-        digits = re.sub(r"\D", "", card)
-        if len(digits) < 4:
+    def _redact_credit_card(self, match: Any) -> str:
+        """Redact a credit card number match."""
+        last_four = _last_four_digits(match.group(0))
+        if last_four is None:
             return "[REDACTED]"
 
-        return "*" * 12 + digits[-4:]
+        return "*" * 12 + last_four
 
 
-# Global redactor instance
-_default_redactor = Redactor()
+@functools.cache
+def _default_redactor() -> Redactor:
+    """Return the global redactor instance, creating it on first use."""
+    return Redactor()
 
 
 def redact_sensitive_data(
@@ -190,7 +658,7 @@ def redact_sensitive_data(
     if patterns:
         redactor = Redactor(patterns)
     else:
-        redactor = _default_redactor
+        redactor = _default_redactor()
 
     return redactor.redact_dict(data, max_depth)
 
@@ -203,7 +671,7 @@ def add_redaction_pattern(name: str, pattern: str) -> None:
         name: Pattern name
         pattern: Regex pattern
     """
-    _default_redactor.patterns[name] = pattern
-    _default_redactor.compiled_patterns[name] = re.compile(
-        pattern, re.IGNORECASE | re.MULTILINE
-    )
+    redactor = _default_redactor()
+    redactor.patterns[name] = pattern
+    redactor.compiled_patterns[name] = _compile_pattern(pattern)
+    redactor._triggers.pop(name, None)
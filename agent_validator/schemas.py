@@ -1,13 +1,74 @@
 """Schema definition and validation logic."""
 
-import json
 from typing import Any, Optional
 
+from . import json_
 from .errors import SchemaError
 from .typing_ import ValidatorFunction
 
 SchemaDict = dict[str, Any]
 
+# Compiled schema nodes are tagged tuples:
+#   ("opt",)                      optional field, value passed through
+#   ("type", expected_type)       simple type check
+#   ("dict", ((key, node), ...))  nested object
+#   ("list", element_node)        homogeneous list
+CompiledNode = tuple[Any, ...]
+
+_OPTIONAL_NODE: CompiledNode = ("opt",)
+
+_SUPPORTED_TYPES = frozenset({str, int, float, bool, list, dict})
+
+
+def _compile_node(value: Any) -> CompiledNode:
+    """Compile a single (already validated) schema value into a node."""
+    if value is None:
+        return _OPTIONAL_NODE
+    if isinstance(value, dict):
+        return _compile_schema(value)
+    if isinstance(value, list):
+        return ("list", _compile_node(value[0]))
+    return ("type", value)
+
+
+def _compile_schema(schema_dict: SchemaDict) -> CompiledNode:
+    """Compile a validated schema dict into a tree of tagged nodes."""
+    return (
+        "dict",
+        tuple((key, _compile_node(value)) for key, value in schema_dict.items()),
+    )
+
+
+def _check_schema_dict(schema_dict: SchemaDict) -> None:
+    """Check a (nested) schema dict without constructing a Schema for it."""
+    for key, value in schema_dict.items():
+        if not isinstance(key, str):
+            raise SchemaError(f"Schema keys must be strings, got {type(key)}")
+
+        if value is None:
+            continue  # Optional field
+
+        if isinstance(value, type):
+            # Simple type validation
+            if value not in _SUPPORTED_TYPES:
+                raise SchemaError(f"Unsupported type {value}")
+        elif isinstance(value, dict):
+            # Nested schema
+            _check_schema_dict(value)
+        elif isinstance(value, list):
+            # List schema
+            if len(value) != 1:
+                raise SchemaError("List schemas must have exactly one element")
+            if isinstance(value[0], type):
+                if value[0] not in _SUPPORTED_TYPES:
+                    raise SchemaError(f"Unsupported list element type {value[0]}")
+            elif isinstance(value[0], dict):
+                _check_schema_dict(value[0])
+            else:
+                raise SchemaError(f"Invalid list element schema: {value[0]}")
+        else:
+            raise SchemaError(f"Invalid schema value type: {type(value)}")
+
 
 class Schema:
     """Schema definition for validating agent outputs."""
@@ -29,38 +90,15 @@ class Schema:
         # Validate the schema itself
         self._validate_schema()
 
+        # Precompile the schema so validation doesn't re-walk it per record
+        self._compiled = _compile_schema(self.schema_dict)
+
     def _validate_schema(self) -> None:
         """Validate that the schema is well-formed."""
         if not isinstance(self.schema_dict, dict):
             raise SchemaError("Schema must be a dictionary")
 
-        for key, value in self.schema_dict.items():
-            if not isinstance(key, str):
-                raise SchemaError(f"Schema keys must be strings, got {type(key)}")
-
-            if value is None:
-                continue  # Optional field
-
-            if isinstance(value, type):
-                # Simple type validation
-                if value not in (str, int, float, bool, list, dict):
-                    raise SchemaError(f"Unsupported type {value}")
-            elif isinstance(value, dict):
-                # Nested schema
-                Schema(value)
-            elif isinstance(value, list):
-                # List schema
-                if len(value) != 1:
-                    raise SchemaError("List schemas must have exactly one element")
-                if isinstance(value[0], type):
-                    if value[0] not in (str, int, float, bool, list, dict):
-                        raise SchemaError(f"Unsupported list element type {value[0]}")
-                elif isinstance(value[0], dict):
-                    Schema(value[0])
-                else:
-                    raise SchemaError(f"Invalid list element schema: {value[0]}")
-            else:
-                raise SchemaError(f"Invalid schema value type: {type(value)}")
+        _check_schema_dict(self.schema_dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert schema to dictionary representation."""
@@ -185,35 +223,16 @@ class Schema:
             "max_str_len": self.max_str_len,
             "validators": list(self.validators.keys()) if self.validators else None,
         }
-        return json.dumps(serialized_dict, indent=2)
+        return json_.dumps(serialized_dict, indent=True)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Schema":
         """Create schema from dictionary representation."""
         schema_dict = data["schema"]
-        # Deserialize if the schema contains string type names
+        # Deserialize string type names at any depth; Python types (as from
+        # to_dict) pass through unchanged
         if isinstance(schema_dict, dict):
-            # Check if any values are strings that look like type names
-            has_string_types = any(
-                isinstance(v, str)
-                and v.lower()
-                in [
-                    "string",
-                    "integer",
-                    "int",
-                    "float",
-                    "number",
-                    "boolean",
-                    "bool",
-                    "list",
-                    "array",
-                    "object",
-                    "dict",
-                ]
-                for v in schema_dict.values()
-            )
-            if has_string_types:
-                schema_dict = cls._deserialize_schema_dict_static(schema_dict)
+            schema_dict = cls._deserialize_schema_dict_static(schema_dict)
 
         return cls(
             schema_dict=schema_dict,
@@ -285,5 +304,5 @@ class Schema:
     @classmethod
     def from_json(cls, json_str: str) -> "Schema":
         """Create schema from JSON string."""
-        data = json.loads(json_str)
+        data = json_.loads(json_str)
         return cls.from_dict(data)
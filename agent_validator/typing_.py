@@ -1,5 +1,6 @@
 """Type definitions and enums for agent_validator."""
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Optional, Union
@@ -12,7 +13,11 @@ class ValidationMode(Enum):
     COERCE = "coerce"  # Safe coercions like "42" -> 42
 
 
-@dataclass
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Config:
     """Configuration for validation and logging."""
 
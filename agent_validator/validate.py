@@ -1,12 +1,12 @@
 """Core validation logic for agent outputs."""
 
-import json
 import time
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
+from . import json_
 from .errors import ValidationError
 from .logging_ import log_validation_result
-from .schemas import Schema
+from .schemas import _OPTIONAL_NODE, CompiledNode, Schema
 from .typing_ import Config, RetryFunction, ValidationMode
 
 
@@ -51,9 +51,18 @@ def validate(
 
     # Parse string output to dict if needed
     if isinstance(agent_output, str):
+        # Reject oversized output before spending time and memory parsing it
+        if _exceeds_size(agent_output, config.max_output_bytes):
+            raise ValidationError(
+                path="root",
+                reason="size_limit",
+                attempt=0,
+                correlation_id=correlation_id,
+            )
+
         try:
-            agent_output = json.loads(agent_output)
-        except json.JSONDecodeError:
+            agent_output = json_.loads(agent_output)
+        except json_.JSONDecodeError:
             if mode == ValidationMode.STRICT:
                 # If we have a retry function, try to get better output
                 if retry_fn:
@@ -69,15 +78,19 @@ def validate(
             # In COERCE mode, treat as plain string
             agent_output = {"raw_output": agent_output}
 
-    # Check size limits
-    output_str = json.dumps(agent_output)
-    if len(output_str.encode()) > config.max_output_bytes:
-        raise ValidationError(
-            path="root",
-            reason="size_limit",
-            attempt=0,
-            correlation_id=correlation_id,
-        )
+    if isinstance(original_input, str):
+        output_sample = _lazy_sample(agent_output)
+    else:
+        # Check size limits
+        serialized = json_.dumpb(agent_output)
+        if len(serialized) > config.max_output_bytes:
+            raise ValidationError(
+                path="root",
+                reason="size_limit",
+                attempt=0,
+                correlation_id=correlation_id,
+            )
+        output_sample = _lazy_sample(agent_output, serialized)
 
     # Check if we need to retry due to JSON parsing failure
     json_parse_failed = False
@@ -98,12 +111,12 @@ def validate(
         json_parse_failed = True
 
     # Initialize retry variables
-    start_time = None
+    start_ns = None
     last_error = None
 
     # If JSON parsing failed and we have a retry function, go directly to retry
     if json_parse_failed and retry_fn:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         last_error = ValidationError(
             path="root",
             reason="Invalid JSON",
@@ -126,7 +139,7 @@ def validate(
                 duration_ms=0,
                 mode=mode.value,
                 context=context,
-                output_sample=output_str[:1000],
+                output_sample=output_sample(),
                 log_to_cloud=log_to_cloud,
                 config=config,
             )
@@ -144,18 +157,18 @@ def validate(
                     duration_ms=0,
                     mode=mode.value,
                     context=context,
-                    output_sample=output_str[:1000],
+                    output_sample=output_sample(),
                     log_to_cloud=log_to_cloud,
                     config=config,
                 )
                 raise
 
             # Try retries
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             last_error = e
 
     # Retry for both JSON parsing failures and schema validation failures
-    if start_time is not None and last_error is not None:
+    if start_ns is not None and last_error is not None:
         for attempt in range(1, retries + 1):
             try:
                 # Call retry function
@@ -163,17 +176,22 @@ def validate(
 
                 # Parse new output
                 if isinstance(new_output, str):
+                    if _exceeds_size(new_output, config.max_output_bytes):
+                        continue
+
                     try:
-                        new_output = json.loads(new_output)
-                    except json.JSONDecodeError:
+                        new_output = json_.loads(new_output)
+                    except json_.JSONDecodeError:
                         if mode == ValidationMode.STRICT:
                             continue
                         new_output = {"raw_output": new_output}
-
-                # Check size limits
-                new_output_str = json.dumps(new_output)
-                if len(new_output_str.encode()) > config.max_output_bytes:
-                    continue
+                    new_output_sample = _lazy_sample(new_output)
+                else:
+                    # Check size limits
+                    new_serialized = json_.dumpb(new_output)
+                    if len(new_serialized) > config.max_output_bytes:
+                        continue
+                    new_output_sample = _lazy_sample(new_output, new_serialized)
 
                 # Validate new output
                 validated_output = _validate_against_schema(
@@ -181,7 +199,7 @@ def validate(
                 )
 
                 # Log successful validation
-                duration_ms = int((time.time() - start_time) * 1000)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
                 log_validation_result(
                     correlation_id=correlation_id,
                     valid=True,
@@ -190,7 +208,7 @@ def validate(
                     duration_ms=duration_ms,
                     mode=mode.value,
                     context=context,
-                    output_sample=new_output_str[:1000],
+                    output_sample=new_output_sample(),
                     log_to_cloud=log_to_cloud,
                     config=config,
                 )
@@ -202,7 +220,7 @@ def validate(
                 continue
 
         # All retries failed
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         log_validation_result(
             correlation_id=correlation_id,
             valid=False,
@@ -211,7 +229,7 @@ def validate(
             duration_ms=duration_ms,
             mode=mode.value,
             context=context,
-            output_sample=output_str[:1000],
+            output_sample=output_sample(),
             log_to_cloud=log_to_cloud,
             config=config,
         )
@@ -219,6 +237,35 @@ def validate(
         raise last_error
 
 
+def _exceeds_size(text: str, limit: int) -> bool:
+    """Check whether a string's UTF-8 encoding is larger than limit bytes."""
+    if len(text) > limit:
+        # Every character encodes to at least one byte
+        return True
+    if text.isascii():
+        return False
+    return len(text.encode()) > limit
+
+
+def _lazy_sample(output: Any, serialized: Optional[bytes] = None) -> Callable[[], str]:
+    """
+    Build a callable producing a truncated sample of an output for logging.
+
+    Retry attempts that fail validation are never logged, so their sample is
+    only serialized if the attempt succeeds.
+
+    Args:
+        output: The parsed output
+        serialized: The output's JSON encoding, if it has already been computed
+
+    Returns:
+        Callable returning the first 1000 characters of the JSON encoding
+    """
+    if serialized is not None:
+        return lambda: serialized.decode()[:1000]
+    return lambda: json_.dumps(output)[:1000]
+
+
 def _validate_against_schema(
     data: Any,
     schema: Schema,
@@ -227,6 +274,17 @@ def _validate_against_schema(
     path: str = "root",
 ) -> Any:
     """Validate data against schema with optional coercion."""
+    return _validate_dict_node(schema._compiled, data, mode, config, path)
+
+
+def _validate_dict_node(
+    node: CompiledNode,
+    data: Any,
+    mode: ValidationMode,
+    config: Config,
+    path: str,
+) -> Any:
+    """Validate data against a compiled nested-object node."""
 
     # Check if data is None (optional field)
     if data is None:
@@ -254,103 +312,134 @@ def _validate_against_schema(
             attempt=0,
         )
 
-    # Validate against schema
-    if isinstance(schema.schema_dict, dict):
-        if not isinstance(data, dict):
-            if mode == ValidationMode.STRICT:
+    if not isinstance(data, dict):
+        if mode == ValidationMode.STRICT:
+            raise ValidationError(
+                path=path,
+                reason=f"Expected dict, got {type(data).__name__}",
+                attempt=0,
+            )
+        # Try to coerce
+        if isinstance(data, str):
+            try:
+                data = json_.loads(data)
+            except json_.JSONDecodeError:
                 raise ValidationError(
                     path=path,
-                    reason=f"Expected dict, got {type(data).__name__}",
+                    reason="Cannot coerce to dict",
+                    attempt=0,
+                ) from None
+        else:
+            raise ValidationError(
+                path=path,
+                reason="Cannot coerce to dict",
+                attempt=0,
+            )
+
+    result = {}
+    for key, child in node[1]:
+        if key not in data:
+            if child is not _OPTIONAL_NODE:
+                raise ValidationError(
+                    path=f"{path}.{key}",
+                    reason="Missing required field",
                     attempt=0,
                 )
-            # Try to coerce
-            if isinstance(data, str):
-                try:
-                    data = json.loads(data)
-                except json.JSONDecodeError:
-                    raise ValidationError(
-                        path=path,
-                        reason="Cannot coerce to dict",
-                        attempt=0,
-                    ) from None
-            else:
+            continue
+
+        result[key] = _NODE_HANDLERS[child[0]](
+            child, data[key], mode, config, f"{path}.{key}"
+        )
+
+    return result
+
+
+def _validate_list_node(
+    node: CompiledNode,
+    value: Any,
+    mode: ValidationMode,
+    config: Config,
+    path: str,
+) -> Any:
+    """Validate a list field against a compiled list node."""
+    if not isinstance(value, list):
+        if mode == ValidationMode.STRICT:
+            raise ValidationError(
+                path=path,
+                reason=f"Expected list, got {type(value).__name__}",
+                attempt=0,
+            )
+        # Try to coerce
+        if isinstance(value, str):
+            try:
+                value = json_.loads(value)
+            except json_.JSONDecodeError:
                 raise ValidationError(
                     path=path,
-                    reason="Cannot coerce to dict",
+                    reason="Cannot coerce to list",
                     attempt=0,
+                ) from None
+        else:
+            raise ValidationError(
+                path=path,
+                reason="Cannot coerce to list",
+                attempt=0,
+            )
+
+    element = node[1]
+    if element[0] == "type":
+        # Lists of scalars are the hot path: items of exactly the expected type
+        # are accepted inline, without a call or a per-item path string
+        expected_type = element[1]
+        max_str_len = config.max_str_len if expected_type is str else None
+        result: list[Any] = []
+        append = result.append
+        for i, item in enumerate(value):
+            if type(item) is expected_type and (
+                max_str_len is None or len(item) <= max_str_len
+            ):
+                append(item)
+            else:
+                append(
+                    _validate_type(item, expected_type, mode, f"{path}[{i}]", config)
                 )
+        return result
 
-        result = {}
-        for key, expected_type in schema.schema_dict.items():
-            if key not in data:
-                if expected_type is not None:
-                    raise ValidationError(
-                        path=f"{path}.{key}",
-                        reason="Missing required field",
-                        attempt=0,
-                    )
-                continue
+    handler = _NODE_HANDLERS[element[0]]
+    return [
+        handler(element, item, mode, config, f"{path}[{i}]")
+        for i, item in enumerate(value)
+    ]
 
-            value = data[key]
-            if expected_type is None:
-                # Optional field
-                result[key] = value
-            elif isinstance(expected_type, type):
-                result[key] = _validate_type(
-                    value, expected_type, mode, f"{path}.{key}", config
-                )
-            elif isinstance(expected_type, dict):
-                # Nested schema
-                nested_schema = Schema(expected_type)
-                result[key] = _validate_against_schema(
-                    value, nested_schema, mode, config, f"{path}.{key}"
-                )
-            elif isinstance(expected_type, list):
-                # List schema
-                if not isinstance(value, list):
-                    if mode == ValidationMode.STRICT:
-                        raise ValidationError(
-                            path=f"{path}.{key}",
-                            reason=f"Expected list, got {type(value).__name__}",
-                            attempt=0,
-                        )
-                    # Try to coerce
-                    if isinstance(value, str):
-                        try:
-                            value = json.loads(value)
-                        except json.JSONDecodeError:
-                            raise ValidationError(
-                                path=f"{path}.{key}",
-                                reason="Cannot coerce to list",
-                                attempt=0,
-                            ) from None
-                    else:
-                        raise ValidationError(
-                            path=f"{path}.{key}",
-                            reason="Cannot coerce to list",
-                            attempt=0,
-                        )
-
-                element_type = expected_type[0]
-                if isinstance(element_type, type):
-                    result[key] = [
-                        _validate_type(
-                            item, element_type, mode, f"{path}.{key}[{i}]", config
-                        )
-                        for i, item in enumerate(value)
-                    ]
-                elif isinstance(element_type, dict):
-                    nested_schema = Schema(element_type)
-                    result[key] = [
-                        _validate_against_schema(
-                            item, nested_schema, mode, config, f"{path}.{key}[{i}]"
-                        )
-                        for i, item in enumerate(value)
-                    ]
 
-        return result
+def _validate_type_node(
+    node: CompiledNode,
+    value: Any,
+    mode: ValidationMode,
+    config: Config,
+    path: str,
+) -> Any:
+    """Validate a value against a compiled simple-type node."""
+    return _validate_type(value, node[1], mode, path, config)
+
+
+def _validate_optional_node(
+    node: CompiledNode,
+    value: Any,
+    mode: ValidationMode,
+    config: Config,
+    path: str,
+) -> Any:
+    """Pass an optional field through unchanged."""
+    return value
+
 
-    return data  # type: ignore
+_NODE_HANDLERS: dict[str, Callable[..., Any]] = {
+    "dict": _validate_dict_node,
+    "list": _validate_list_node,
+    "type": _validate_type_node,
+    "opt": _validate_optional_node,
+}
 
 
 def _validate_type(
@@ -362,7 +451,7 @@ def _validate_type(
 ) -> Any:
     """Validate and optionally coerce a value to the expected type."""
 
-    if isinstance(value, expected_type):
+    if type(value) is expected_type or isinstance(value, expected_type):
         # Apply size limits for strings
         if (
             expected_type is str
@@ -385,80 +474,102 @@ def _validate_type(
         )
 
     # Coerce in COERCE mode
-    if expected_type is int:
-        if isinstance(value, str):
-            try:
-                return int(value.strip())
-            except ValueError:
-                raise ValidationError(
-                    path=path,
-                    reason="Cannot coerce to int",
-                    attempt=0,
-                ) from None
-        elif isinstance(value, float):
-            return int(value)
-        else:
+    coercer = _COERCERS.get(expected_type)
+    if coercer is None:
+        raise ValidationError(
+            path=path,
+            reason=f"Cannot coerce to {expected_type.__name__}",
+            attempt=0,
+        )
+    return coercer(value, path, config)
+
+
+def _coerce_int(value: Any, path: str, config: Optional[Config]) -> int:
+    """Coerce a value to int."""
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
             raise ValidationError(
                 path=path,
                 reason="Cannot coerce to int",
                 attempt=0,
-            )
+            ) from None
+    elif isinstance(value, float):
+        return int(value)
+    else:
+        raise ValidationError(
+            path=path,
+            reason="Cannot coerce to int",
+            attempt=0,
+        )
 
-    elif expected_type is float:
-        if isinstance(value, str):
-            try:
-                return float(value.strip())
-            except ValueError:
-                raise ValidationError(
-                    path=path,
-                    reason="Cannot coerce to float",
-                    attempt=0,
-                ) from None
-        elif isinstance(value, int):
-            return float(value)
-        else:
+
+def _coerce_float(value: Any, path: str, config: Optional[Config]) -> float:
+    """Coerce a value to float."""
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
             raise ValidationError(
                 path=path,
                 reason="Cannot coerce to float",
                 attempt=0,
-            )
+            ) from None
+    elif isinstance(value, int):
+        return float(value)
+    else:
+        raise ValidationError(
+            path=path,
+            reason="Cannot coerce to float",
+            attempt=0,
+        )
 
-    elif expected_type is bool:
-        if isinstance(value, str):
-            value_lower = value.strip().lower()
-            if value_lower in ("true", "1", "yes", "on"):
-                return True
-            elif value_lower in ("false", "0", "no", "off"):
-                return False
-            else:
-                raise ValidationError(
-                    path=path,
-                    reason="Cannot coerce to bool",
-                    attempt=0,
-                )
-        elif isinstance(value, int):
-            return bool(value)
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "off"})
+
+
+def _coerce_bool(value: Any, path: str, config: Optional[Config]) -> bool:
+    """Coerce a value to bool."""
+    if isinstance(value, str):
+        value_lower = value.strip().lower()
+        if value_lower in _TRUE_STRINGS:
+            return True
+        elif value_lower in _FALSE_STRINGS:
+            return False
         else:
             raise ValidationError(
                 path=path,
                 reason="Cannot coerce to bool",
                 attempt=0,
             )
+    elif isinstance(value, int):
+        return bool(value)
+    else:
+        raise ValidationError(
+            path=path,
+            reason="Cannot coerce to bool",
+            attempt=0,
+        )
 
-    elif expected_type is str:
-        result = str(value)
-        # Apply size limits for coerced strings
-        if config and len(result) > config.max_str_len:
-            raise ValidationError(
-                path=path,
-                reason="size_limit",
-                attempt=0,
-            )
-        return result
 
-    else:
+def _coerce_str(value: Any, path: str, config: Optional[Config]) -> str:
+    """Coerce a value to str."""
+    result = str(value)
+    # Apply size limits for coerced strings
+    if config and len(result) > config.max_str_len:
         raise ValidationError(
             path=path,
-            reason=f"Cannot coerce to {expected_type.__name__}",
+            reason="size_limit",
             attempt=0,
         )
+    return result
+
+
+_COERCERS: dict[type, Callable[[Any, str, Optional[Config]], Any]] = {
+    int: _coerce_int,
+    float: _coerce_float,
+    bool: _coerce_bool,
+    str: _coerce_str,
+}
@@ -1,19 +1,100 @@
 """Command-line interface for agent_validator."""
 
-import json
+import functools
+import hashlib
+import os
+import pickle
 import sys
 import uuid
-from typing import Any, Optional
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
 
 import typer
 
-from agent_validator import Schema, ValidationMode, validate
 from agent_validator.config import create_default_config, get_config, save_config
 from agent_validator.logging_ import clear_logs, get_recent_logs
 
+if TYPE_CHECKING:
+    from agent_validator import Schema, ValidationMode
+    from agent_validator.typing_ import Config
 
-def parse_validation_mode(value: str) -> ValidationMode:
+
+@functools.cache
+def _get_session() -> Any:
+    """Return the shared HTTP session used for cloud service requests.
+
+    Reusing one session keeps connections to the cloud endpoint alive across
+    calls instead of repeating DNS, TCP and TLS setup for every request.
+
+    Returns:
+        A ``requests.Session`` with a pooled HTTP adapter mounted.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(ts: str) -> str:
+    """Format an ISO timestamp for the log tables.
+
+    Args:
+        ts: ISO 8601 timestamp, optionally with a trailing ``Z``.
+
+    Returns:
+        The timestamp as ``YYYY-MM-DD HH:MM:SS``, or ``ts`` unchanged if it
+        cannot be parsed.
+    """
+    # The output has no offset, so a trailing "Z" can simply be dropped
+    core = ts[:-1] if ts.endswith("Z") else ts
+    try:
+        return datetime.fromisoformat(core).strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, TypeError):
+        return ts
+
+
+_TYPE_MAP: dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "int": int,
+    "float": float,
+    "number": float,
+    "boolean": bool,
+    "bool": bool,
+    "list": list,
+    "array": list,
+    "dict": dict,
+    "object": dict,
+}
+# Exact-match lookup including common capitalisations, checked before
+# falling back to a lowercased lookup in _TYPE_MAP
+_TYPE_LOOKUP: dict[str, type] = {
+    variant: value
+    for name, value in _TYPE_MAP.items()
+    for variant in (name, name.capitalize(), name.upper())
+}
+
+
+# Log table layout shared by the logs and cloud_logs commands
+_TABLE_HEADER = (
+    "┌─────────────────────────────────────┬────────┬─────────────┬─────────┬──────────┬─────────────┬─────────┬─────────┐\n"
+    "│ Timestamp                           │ Status │ Correlation │ Mode    │ Attempts │ Duration    │ Errors  │ Size    │\n"
+    "├─────────────────────────────────────┼────────┼─────────────┼─────────┼──────────┼─────────────┼─────────┼─────────┤"
+)
+_TABLE_FOOTER = "└─────────────────────────────────────┴────────┴─────────────┴─────────┴──────────┴─────────────┴─────────┴─────────┘"
+_ROW_FMT = "│ {:<35} │ {:>6} │ {:>11} │ {:>7} │ {:>8} │ {:>9}ms │ {:>7} │ {:>7} │"
+
+
+def parse_validation_mode(value: str) -> "ValidationMode":
     """Parse validation mode with case-insensitive support."""
+    from agent_validator import ValidationMode
+
     value_lower = value.lower()
     if value_lower == "strict":
         return ValidationMode.STRICT
@@ -27,35 +108,103 @@ def parse_validation_mode(value: str) -> ValidationMode:
 
 def convert_string_schema_to_types(schema_data: Any) -> Any:
     """Convert string-based schema to Python types."""
-    if isinstance(schema_data, dict):
-        converted = {}
-        for key, value in schema_data.items():
-            converted[key] = convert_string_schema_to_types(value)
-        return converted
-    elif isinstance(schema_data, list):
-        if len(schema_data) == 1:
-            # List schema: ["string"] -> [str]
-            return [convert_string_schema_to_types(schema_data[0])]
-        else:
-            return [convert_string_schema_to_types(item) for item in schema_data]
-    elif isinstance(schema_data, str):
-        # Convert string type names to Python types
-        type_map = {
-            "string": str,
-            "integer": int,
-            "int": int,
-            "float": float,
-            "number": float,
-            "boolean": bool,
-            "bool": bool,
-            "list": list,
-            "array": list,
-            "dict": dict,
-            "object": dict,
-        }
-        return type_map.get(schema_data.lower(), schema_data)
+    if isinstance(schema_data, str):
+        converted_type = _TYPE_LOOKUP.get(schema_data)
+        if converted_type is not None:
+            return converted_type
+        return _TYPE_MAP.get(schema_data.lower(), schema_data)
+
+    # Walk the schema with an explicit stack, copying containers and
+    # replacing string leaves in the copies.
+    root = [schema_data]
+    stack: list[tuple[Any, Any]] = [(root, 0)]
+    # Bind hot lookups to locals for the loop
+    pop = stack.pop
+    push = stack.extend
+    type_lookup_get = _TYPE_LOOKUP.get
+    type_map_get = _TYPE_MAP.get
+    while stack:
+        container, key = pop()
+        value = container[key]
+        if isinstance(value, dict):
+            converted: Any = dict(value)
+            container[key] = converted
+            push((converted, child) for child in converted)
+        elif isinstance(value, list):
+            converted = list(value)
+            container[key] = converted
+            push((converted, index) for index in range(len(converted)))
+        elif isinstance(value, str):
+            converted = type_lookup_get(value)
+            if converted is None:
+                converted = type_map_get(value.lower(), value)
+            container[key] = converted
+    return root[0]
+
+
+def _schema_cache_file(schema_path: str) -> Path:
+    """Return the cache file used for a schema path."""
+    key = hashlib.blake2b(
+        os.path.abspath(schema_path).encode(), digest_size=16
+    ).hexdigest()
+    return Path.home() / ".agent_validator" / "cache" / "schemas" / f"{key}.pickle"
+
+
+def load_schema_file(schema_path: str) -> "Schema":
+    """
+    Load a schema JSON file, reusing a cached Schema while the file is unchanged.
+
+    Args:
+        schema_path: Path to the schema JSON file
+
+    Returns:
+        Schema built from the file
+    """
+    from agent_validator import Schema, __version__, json_
+
+    stat = os.stat(schema_path)
+    # Pickled Schemas are only valid for the release and protocol that wrote them
+    signature = (
+        __version__,
+        pickle.HIGHEST_PROTOCOL,
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+    cache_file = _schema_cache_file(schema_path)
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached_signature, cached_schema = pickle.load(f)
+        if cached_signature == signature and isinstance(cached_schema, Schema):
+            return cached_schema
+    except Exception:
+        # Missing, corrupt or incompatible cache entries (any unpickling
+        # error) are rebuilt below
+        pass
+
+    with open(schema_path, "rb") as f:
+        schema_data = json_.loads(f.read())
+
+    # Handle both direct schema and wrapped schema formats
+    if "schema" in schema_data:
+        # Wrapped format: {"schema": {...}}
+        # Convert string types in the nested schema
+        schema = Schema(convert_string_schema_to_types(schema_data["schema"]))
     else:
-        return schema_data
+        # Direct format: {...} - convert string types to Python types
+        schema = Schema(convert_string_schema_to_types(schema_data))
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump((signature, schema), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Caching is best effort
+        pass
+
+    return schema
 
 
 app = typer.Typer(
@@ -81,16 +230,12 @@ def logs(
         typer.echo("No logs found.")
         return
 
-    # Print table header
-    typer.echo(
-        "┌─────────────────────────────────────┬────────┬─────────────┬─────────┬──────────┬─────────────┬─────────┬─────────┐"
-    )
-    typer.echo(
-        "│ Timestamp                           │ Status │ Correlation │ Mode    │ Attempts │ Duration    │ Errors  │ Size    │"
-    )
-    typer.echo(
-        "├─────────────────────────────────────┼────────┼─────────────┼─────────┼──────────┼─────────────┼─────────┼─────────┤"
-    )
+    # Build the whole table and print it with a single echo
+    lines = [_TABLE_HEADER]
+    # Bind hot lookups to locals for the row loop
+    append = lines.append
+    row_fmt = _ROW_FMT.format
+    format_ts = _format_timestamp
 
     for entry in entries:
         ts = entry.get("ts", "unknown")
@@ -112,17 +257,7 @@ def logs(
             display_id = "none"
 
         # Format timestamp for better readability
-        if ts != "unknown":
-            try:
-                # Parse ISO timestamp and format it nicely
-                from datetime import datetime
-
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                formatted_ts = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except (ValueError, TypeError):
-                formatted_ts = ts
-        else:
-            formatted_ts = ts
+        formatted_ts = format_ts(ts) if ts != "unknown" else ts
 
         # Get additional info
         errors = entry.get("errors", [])
@@ -138,15 +273,23 @@ def logs(
         else:
             size_display = f"{output_size}B"
 
-        # Print table row
-        typer.echo(
-            f"│ {formatted_ts:<35} │ {valid:>6} │ {display_id:>11} │ {mode:>7} │ {attempts:>8} │ {duration_ms:>9}ms │ {error_count:>7} │ {size_display:>7} │"
+        # Add table row
+        append(
+            row_fmt(
+                formatted_ts,
+                valid,
+                display_id,
+                mode,
+                attempts,
+                duration_ms,
+                error_count,
+                size_display,
+            )
         )
 
-    # Print table footer
-    typer.echo(
-        "└─────────────────────────────────────┴────────┴─────────────┴─────────┴──────────┴─────────────┴─────────┴─────────┘"
-    )
+    # Add table footer
+    lines.append(_TABLE_FOOTER)
+    typer.echo("\n".join(lines))
 
 
 @app.command()
@@ -158,36 +301,24 @@ def test(
     ),
 ) -> None:
     """Test validation with schema and input files."""
+    from agent_validator import json_, validate
+
     try:
         # Parse validation mode with case-insensitive support
         validation_mode = parse_validation_mode(mode)
 
         # Load schema
-        with open(schema_path) as f:
-            schema_data = json.load(f)
-
-        # Handle both direct schema and wrapped schema formats
-        if "schema" in schema_data:
-            # Wrapped format: {"schema": {...}}
-            # Convert string types in the nested schema
-            converted_schema_dict = convert_string_schema_to_types(
-                schema_data["schema"]
-            )
-            schema = Schema(converted_schema_dict)
-        else:
-            # Direct format: {...} - convert string types to Python types
-            converted_schema = convert_string_schema_to_types(schema_data)
-            schema = Schema(converted_schema)
+        schema = load_schema_file(schema_path)
 
         # Load input
-        with open(input_path) as f:
-            input_data = json.load(f)
+        with open(input_path, "rb") as f:
+            input_data = json_.loads(f.read())
 
         # Validate
         result = validate(input_data, schema, mode=validation_mode)
 
         typer.echo("✓ Validation successful")
-        typer.echo(json.dumps(result, indent=2))
+        typer.echo(json_.dumps(result, indent=True))
         sys.exit(0)
 
     except Exception as e:
@@ -202,6 +333,135 @@ def id() -> None:
     typer.echo(correlation_id)
 
 
+def _format_config(config: "Config", show_secrets: bool) -> str:
+    """
+    Render the configuration as shown by ``config --show``.
+
+    Args:
+        config: Configuration to render
+        show_secrets: Whether to print sensitive values instead of masking them
+
+    Returns:
+        The configuration listing
+    """
+    lines = [
+        "Current configuration:",
+        f"  max_output_bytes: {config.max_output_bytes}",
+        f"  max_str_len: {config.max_str_len}",
+        f"  max_list_len: {config.max_list_len}",
+        f"  max_dict_keys: {config.max_dict_keys}",
+        f"  log_to_cloud: {config.log_to_cloud}",
+        f"  cloud_endpoint: {config.cloud_endpoint}",
+        f"  timeout_s: {config.timeout_s}",
+        f"  retries: {config.retries}",
+    ]
+
+    # Handle sensitive values based on show_secrets flag
+    if show_secrets:
+        lines.append(f"  license_key: {config.license_key or 'not set'}")
+        lines.append(f"  webhook_secret: {config.webhook_secret or 'not set'}")
+    else:
+        lines.append(f"  license_key: {'***' if config.license_key else 'not set'}")
+        lines.append(
+            f"  webhook_secret: {'***' if config.webhook_secret else 'not set'}"
+        )
+    return "\n".join(lines)
+
+
+# Batch config operations that set a string field: op -> (field, message)
+_CONFIG_SETTERS = {
+    "set-license-key": ("license_key", "License key updated."),
+    "set-endpoint": ("cloud_endpoint", "Cloud endpoint updated."),
+    "set-webhook-secret": ("webhook_secret", "Webhook secret updated."),
+}
+
+
+def _config_operation_error(operation: Any) -> Optional[str]:
+    """
+    Check one batch config operation.
+
+    Args:
+        operation: Parsed operation from the batch document
+
+    Returns:
+        Why the operation is invalid, or None if it can be applied
+    """
+    if not isinstance(operation, dict):
+        return f"operation must be an object, got {operation!r}"
+
+    op = operation.get("op")
+    if op == "show":
+        if not isinstance(operation.get("show_secrets", False), bool):
+            return "show_secrets must be true or false"
+    elif op in _CONFIG_SETTERS:
+        if not isinstance(operation.get("value"), str):
+            return f"{op} needs a string value"
+    elif op == "set-log-to-cloud":
+        if not isinstance(operation.get("value"), bool):
+            return f"{op} needs a true or false value"
+    else:
+        return f"unknown operation {op!r}"
+    return None
+
+
+def _run_config_batch(config: "Config", document: str) -> None:
+    """
+    Apply a list of config operations and print their outputs as a JSON array.
+
+    Each operation is an object with an ``op`` of ``show`` (optionally with a
+    boolean ``show_secrets``), ``set-license-key``, ``set-endpoint`` or
+    ``set-webhook-secret`` (with a string ``value``), or ``set-log-to-cloud``
+    (with a boolean ``value``). Operations run in order, so a ``show`` reflects
+    earlier sets. Nothing is applied if any operation is invalid.
+
+    Args:
+        config: Configuration to read and update
+        document: JSON array of operations
+
+    Raises:
+        typer.Exit: If the document is not a valid list of operations
+    """
+    from agent_validator import json_
+
+    try:
+        operations = json_.loads(document)
+    except json_.JSONDecodeError as e:
+        typer.echo(f"Invalid config batch: {e}", err=True)
+        raise typer.Exit(1) from None
+
+    if not isinstance(operations, list):
+        typer.echo("Invalid config batch: expected a JSON array", err=True)
+        raise typer.Exit(1)
+
+    for index, operation in enumerate(operations):
+        error = _config_operation_error(operation)
+        if error is not None:
+            typer.echo(f"Invalid config batch: operation {index}: {error}", err=True)
+            raise typer.Exit(1)
+
+    results = []
+    changed = False
+    for operation in operations:
+        op = operation["op"]
+        if op == "show":
+            results.append(_format_config(config, operation.get("show_secrets", False)))
+        elif op in _CONFIG_SETTERS:
+            field, message = _CONFIG_SETTERS[op]
+            setattr(config, field, operation["value"])
+            results.append(message)
+            changed = True
+        else:
+            config.log_to_cloud = operation["value"]
+            results.append(
+                f"Cloud logging {'enabled' if config.log_to_cloud else 'disabled'}."
+            )
+            changed = True
+
+    if changed:
+        save_config(config)
+    typer.echo(json_.dumps(results))
+
+
 @app.command()
 def config(
     show: bool = typer.Option(False, "--show", help="Show current configuration"),
@@ -222,30 +482,21 @@ def config(
     set_log_to_cloud: Optional[bool] = typer.Option(
         None, "--set-log-to-cloud", help="Enable/disable cloud logging", is_flag=True
     ),
+    batch: Optional[str] = typer.Option(
+        None,
+        "--batch",
+        help="Run a JSON array of config operations ('-' reads it from stdin)",
+    ),
 ) -> None:
     """Manage configuration."""
     config = get_config()
 
+    if batch is not None:
+        _run_config_batch(config, sys.stdin.read() if batch == "-" else batch)
+        return
+
     if show:
-        typer.echo("Current configuration:")
-        typer.echo(f"  max_output_bytes: {config.max_output_bytes}")
-        typer.echo(f"  max_str_len: {config.max_str_len}")
-        typer.echo(f"  max_list_len: {config.max_list_len}")
-        typer.echo(f"  max_dict_keys: {config.max_dict_keys}")
-        typer.echo(f"  log_to_cloud: {config.log_to_cloud}")
-        typer.echo(f"  cloud_endpoint: {config.cloud_endpoint}")
-        typer.echo(f"  timeout_s: {config.timeout_s}")
-        typer.echo(f"  retries: {config.retries}")
-
-        # Handle sensitive values based on show_secrets flag
-        if show_secrets:
-            typer.echo(f"  license_key: {config.license_key or 'not set'}")
-            typer.echo(f"  webhook_secret: {config.webhook_secret or 'not set'}")
-        else:
-            typer.echo(f"  license_key: {'***' if config.license_key else 'not set'}")
-            typer.echo(
-                f"  webhook_secret: {'***' if config.webhook_secret else 'not set'}"
-            )
+        typer.echo(_format_config(config, show_secrets))
         return
 
     if set_license_key is not None:
@@ -301,7 +552,7 @@ def webhook(
             url = f"{config.cloud_endpoint}/webhooks/generate"
             params = {"force": force} if force else {}
 
-            response = requests.post(
+            response = _get_session().post(
                 url,
                 headers={"license-key": config.license_key},
                 params=params,
@@ -365,7 +616,7 @@ def webhook(
 
         elif status:
             # Check webhook status
-            response = requests.get(
+            response = _get_session().get(
                 f"{config.cloud_endpoint}/webhooks/status",
                 headers={"license-key": config.license_key},
                 timeout=10,
@@ -382,7 +633,7 @@ def webhook(
 
         elif revoke:
             # Revoke webhook secret
-            response = requests.delete(
+            response = _get_session().delete(
                 f"{config.cloud_endpoint}/webhooks/revoke",
                 headers={"license-key": config.license_key},
                 timeout=10,
@@ -427,28 +678,26 @@ def cloud_logs(
     try:
         import requests
 
-        response = requests.get(
+        from agent_validator import json_
+
+        response = _get_session().get(
             f"{config.cloud_endpoint}/logs?limit={n}",
             headers={"license-key": config.license_key},
             timeout=10,
         )
         response.raise_for_status()
 
-        logs = response.json()
+        logs = json_.loads(response.content)
         if not logs:
             typer.echo("No logs found in cloud service.")
             return
 
-        # Print table header
-        typer.echo(
-            "┌─────────────────────────────────────┬────────┬─────────────┬─────────┬──────────┬─────────────┬─────────┬─────────┐"
-        )
-        typer.echo(
-            "│ Timestamp                           │ Status │ Correlation │ Mode    │ Attempts │ Duration    │ Errors  │ Size    │"
-        )
-        typer.echo(
-            "├─────────────────────────────────────┼────────┼─────────────┼─────────┼──────────┼─────────────┼─────────┼─────────┤"
-        )
+        # Build the whole table and print it with a single echo
+        lines = [_TABLE_HEADER]
+        # Bind hot lookups to locals for the row loop
+        append = lines.append
+        row_fmt = _ROW_FMT.format
+        format_ts = _format_timestamp
 
         for log in logs:
             ts = log.get("ts", "unknown")
@@ -470,17 +719,7 @@ def cloud_logs(
                 display_id = "none"
 
             # Format timestamp for better readability
-            if ts != "unknown":
-                try:
-                    # Parse ISO timestamp and format it nicely
-                    from datetime import datetime
-
-                    dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                    formatted_ts = dt.strftime("%Y-%m-%d %H:%M:%S")
-                except (ValueError, TypeError):
-                    formatted_ts = ts
-            else:
-                formatted_ts = ts
+            formatted_ts = format_ts(ts) if ts != "unknown" else ts
 
             # Get additional info
             errors = log.get("errors", [])
@@ -496,21 +735,29 @@ def cloud_logs(
             else:
                 size_display = f"{output_size}B"
 
-            # Print table row
-            typer.echo(
-                f"│ {formatted_ts:<35} │ {valid:>6} │ {display_id:>11} │ {mode:>7} │ {attempts:>8} │ {duration_ms:>9}ms │ {error_count:>7} │ {size_display:>7} │"
+            # Add table row
+            append(
+                row_fmt(
+                    formatted_ts,
+                    valid,
+                    display_id,
+                    mode,
+                    attempts,
+                    duration_ms,
+                    error_count,
+                    size_display,
+                )
             )
 
-        # Print table footer
-        typer.echo(
-            "└─────────────────────────────────────┴────────┴─────────────┴─────────┴──────────┴─────────────┴─────────┴─────────┘"
-        )
+        # Add table footer
+        lines.append(_TABLE_FOOTER)
+        typer.echo("\n".join(lines))
 
     except requests.exceptions.ConnectionError:
         typer.echo(
             f"❌ Cannot connect to {config.cloud_endpoint}. Is the server running?"
         )
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, json_.JSONDecodeError) as e:
         typer.echo(f"❌ Failed to fetch cloud logs: {e}")
 
 
@@ -530,29 +777,44 @@ def dashboard(
         return
 
     try:
-        import threading
-        import time
-        import urllib.parse
-        import urllib.request
-        from http.server import BaseHTTPRequestHandler, HTTPServer
+        import shutil
+        import webbrowser
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
         class DashboardProxy(BaseHTTPRequestHandler):
             def do_GET(self) -> None:
                 if self.path == "/":
                     # Proxy the dashboard request with proper headers
+                    headers_sent = False
                     try:
-                        req = urllib.request.Request(
+                        with _get_session().get(
                             f"{config.cloud_endpoint}/dashboard",
                             headers={"license-key": config.license_key or ""},
-                        )
-
-                        with urllib.request.urlopen(req) as response:
-                            content = response.read()
+                            stream=True,
+                            timeout=10,
+                        ) as response:
+                            response.raise_for_status()
+                            response.raw.decode_content = True
                             self.send_response(200)
                             self.send_header("Content-type", "text/html")
+                            # The body is decoded on the way through, so the
+                            # upstream length only holds for unencoded bodies
+                            content_length = response.headers.get("Content-Length")
+                            if content_length and not response.headers.get(
+                                "Content-Encoding"
+                            ):
+                                self.send_header("Content-Length", content_length)
                             self.end_headers()
-                            self.wfile.write(content)
+                            headers_sent = True
+                            shutil.copyfileobj(response.raw, self.wfile, 65536)
                     except Exception as e:
+                        if headers_sent:
+                            # A 200 is already on the wire, so an error page
+                            # would corrupt the body; drop the connection so the
+                            # browser sees a truncated response instead
+                            typer.echo(f"❌ Dashboard proxy failed mid-response: {e}")
+                            self.close_connection = True
+                            return
                         self.send_response(500)
                         self.send_header("Content-type", "text/html")
                         self.end_headers()
@@ -571,11 +833,8 @@ def dashboard(
                 # Suppress logging
                 pass
 
-        # Start local proxy server
-        server = HTTPServer(("localhost", port), DashboardProxy)
-        server_thread = threading.Thread(target=server.serve_forever)
-        server_thread.daemon = True
-        server_thread.start()
+        # Start local proxy server; it is listening once constructed
+        server = ThreadingHTTPServer(("localhost", port), DashboardProxy)
 
         local_url = f"http://localhost:{port}"
 
@@ -584,44 +843,132 @@ def dashboard(
 
         if open_browser:
             try:
-                import webbrowser
-
-                # Give server a moment to start
-                time.sleep(0.5)
+                # The server socket is already listening, so the browser can
+                # connect as soon as it opens
                 webbrowser.open(local_url)
                 typer.echo(f"🌐 Opening dashboard at {local_url}")
-                typer.echo("Press Ctrl+C to stop the proxy server")
-
-                # Keep the server running
-                try:
-                    while True:
-                        time.sleep(1)
-                except KeyboardInterrupt:
-                    typer.echo("\n🛑 Stopping proxy server...")
-                    server.shutdown()
-
             except Exception as e:
                 typer.echo(f"❌ Failed to open browser: {e}")
                 typer.echo(f"Please visit: {local_url}")
         else:
             typer.echo(f"Dashboard URL: {local_url}")
-            typer.echo("Press Ctrl+C to stop the proxy server")
-            try:
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                typer.echo("\n🛑 Stopping proxy server...")
-                server.shutdown()
+
+        # Serve on this thread until Ctrl+C interrupts serve_forever
+        typer.echo("Press Ctrl+C to stop the proxy server")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            typer.echo("\n🛑 Stopping proxy server...")
+        finally:
+            server.server_close()
 
     except Exception as e:
         typer.echo(f"❌ Failed to start dashboard proxy: {e}")
 
 
+def _fast_dispatch(argv: list[str]) -> bool:
+    """
+    Run plain ``logs`` invocations without going through Click.
+
+    This is the command most often called from scripts, so its common
+    argument shapes are dispatched directly. Anything else, including help
+    and malformed options, is left to the Typer app.
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        True if the command was handled here
+    """
+    if argv[:1] == ["logs"]:
+        options = argv[1:]
+        if not options:
+            logs(n=20, clear=False)
+            return True
+        if len(options) == 2 and options[0] in ("-n", "--number"):
+            try:
+                n = int(options[1])
+            except ValueError:
+                return False
+            logs(n=n, clear=False)
+            return True
+
+    return False
+
+
+def _serve_stdio() -> None:
+    """
+    Run CLI invocations read as JSON lines from stdin, one reply per line.
+
+    Each request is ``{"args": [...]}`` and each reply is
+    ``{"stdout": ..., "stderr": ..., "rc": ...}``. This lets callers such as
+    the smoke tests run many commands in one interpreter. Malformed requests
+    get a reply with ``rc`` 2, and commands see an empty stdin so they can't
+    consume the requests that follow.
+    """
+    import contextlib
+    import io
+    import json
+    import traceback
+
+    channel = sys.stdout
+    request_lines = sys.stdin
+    for line in request_lines:
+        try:
+            args = json.loads(line)["args"]
+            if not isinstance(args, list) or not all(
+                isinstance(arg, str) for arg in args
+            ):
+                raise TypeError("args must be a list of strings")
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            reply = {"stdout": "", "stderr": f"Invalid request: {e!r}\n", "rc": 2}
+            channel.write(json.dumps(reply) + "\n")
+            channel.flush()
+            continue
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        rc = 0
+        sys.stdin = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                if not _fast_dispatch(args):
+                    app(args, prog_name="agent-validator")
+            except SystemExit as e:
+                if isinstance(e.code, int) or e.code is None:
+                    rc = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    rc = 1
+            except Exception:
+                traceback.print_exc()
+                rc = 1
+            finally:
+                sys.stdin = request_lines
+        reply = {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "rc": rc}
+        channel.write(json.dumps(reply) + "\n")
+        channel.flush()
+
+
 def main() -> None:
     """Main entry point."""
+    argv = sys.argv[1:]
+
+    # Minting a correlation ID needs neither config nor Click
+    if argv == ["id"]:
+        id()
+        return
+
     # Create default config on first run
     create_default_config()
 
+    # Hidden mode used by the smoke tests
+    if argv == ["--serve-stdio"]:
+        _serve_stdio()
+        return
+
+    if _fast_dispatch(argv):
+        return
+
     app()
 
 
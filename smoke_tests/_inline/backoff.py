@@ -0,0 +1,56 @@
+"""Check the exponential backoff and jitter of create_retry_function."""
+
+import sys
+import time
+
+from agent_validator.retry import create_retry_function
+
+attempt_count = 0
+start = time.perf_counter_ns()
+delays = []
+
+
+def failing_function(prompt, context):
+    global attempt_count, delays
+    attempt_count += 1
+    # Monotonic, high-resolution clock, so NTP adjustments can't skew delays
+    delays.append(time.perf_counter_ns() - start)
+
+    if attempt_count < 3:
+        raise Exception("Simulated failure")  # This will trigger retry
+    else:
+        return "success"
+
+
+# Create retry function with backoff
+retry_fn_with_backoff = create_retry_function(
+    failing_function, max_retries=2, base_delay=0.5, max_delay=2.0, factor=2.0
+)
+
+try:
+    result = retry_fn_with_backoff("test prompt", {"test": "context"})
+
+    if attempt_count != 3:
+        print(f"Expected 3 attempts, got {attempt_count}")
+        sys.exit(1)
+
+    # Check that delays show exponential backoff with jitter
+    if len(delays) < 2:
+        print("Not enough delay measurements")
+        sys.exit(1)
+
+    # First delay should be around 0.5s (with jitter)
+    if not 300_000_000 <= delays[1] <= 1_000_000_000:
+        print(f"First delay {delays[1] / 1e9}s not in expected range")
+        sys.exit(1)
+
+    # Second delay should be around 1s (with jitter)
+    if not 700_000_000 <= delays[2] <= 2_000_000_000:
+        print(f"Second delay {delays[2] / 1e9}s not in expected range")
+        sys.exit(1)
+
+    print("✅ Exponential backoff and jitter working correctly")
+
+except Exception as e:
+    print(f"Retry function failed: {e}")
+    sys.exit(1)
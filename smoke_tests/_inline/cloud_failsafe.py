@@ -0,0 +1,33 @@
+"""Check that an unreachable cloud endpoint doesn't break validation."""
+
+import sys
+
+from agent_validator import Config, Schema, ValidationMode, validate
+
+schema = Schema({"name": str})
+
+data = {"name": "John"}
+
+# Use invalid cloud endpoint to trigger cloud error
+config = Config(
+    log_to_cloud=True,
+    license_key="invalid-key",
+    cloud_endpoint="http://invalid-endpoint-that-does-not-exist.com",
+)
+
+# This should succeed even if cloud logging fails
+result = validate(
+    data,
+    schema,
+    mode=ValidationMode.STRICT,
+    log_to_cloud=True,
+    config=config,
+    context={"test": "cloud_failsafe"},
+)
+
+# Check that validation succeeded
+if result["name"] != "John":
+    print("Validation failed")
+    sys.exit(1)
+
+print("✅ Cloud failsafe working - validation succeeded despite cloud error")
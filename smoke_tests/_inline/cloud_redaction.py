@@ -0,0 +1,27 @@
+"""Send secrets to the cloud endpoint given as the first argument."""
+
+import sys
+
+from agent_validator import Config, Schema, ValidationMode, validate
+
+schema = Schema({"api_key": str, "email": str})
+
+sensitive_data = {
+    "api_key": "sk-cloud-test-key-12345",
+    "email": "cloud-test@example.com",
+}
+
+config = Config(
+    log_to_cloud=True, license_key="license-smoke-test-key", cloud_endpoint=sys.argv[1]
+)
+
+result = validate(
+    sensitive_data,
+    schema,
+    mode=ValidationMode.STRICT,
+    log_to_cloud=True,
+    config=config,
+    context={"test": "cloud_redaction"},
+)
+
+print("✅ Cloud validation with sensitive data successful")
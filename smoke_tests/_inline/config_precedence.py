@@ -0,0 +1,18 @@
+"""Check that environment variables override the config file."""
+
+import os
+import sys
+
+from agent_validator.config import get_config
+
+# Set environment variable
+os.environ["AGENT_VALIDATOR_TIMEOUT_S"] = "30"
+
+# Get config (should pick up env var)
+config = get_config()
+
+if config.timeout_s != 30:
+    print(f"Expected timeout_s=30, got {config.timeout_s}")
+    sys.exit(1)
+
+print("✅ Environment variable precedence working")
@@ -0,0 +1,17 @@
+"""Log a single secret so the caller can inspect how it was redacted."""
+
+from agent_validator import Schema, ValidationMode, validate
+
+schema = Schema({"config": str})
+
+# Simple sensitive data
+sensitive_data = {"config": "api_key=sk-1234567890abcdef"}
+
+result = validate(
+    sensitive_data,
+    schema,
+    mode=ValidationMode.STRICT,
+    context={"test": "debug_redaction"},
+)
+
+print("✅ Debug validation successful")
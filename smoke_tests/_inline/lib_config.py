@@ -0,0 +1,27 @@
+"""Check the Config defaults and overrides."""
+
+import sys
+
+from agent_validator import Config
+
+# Test default config
+config = Config()
+
+if config.max_output_bytes != 131072:
+    sys.exit(1)
+
+if config.max_str_len != 8192:
+    sys.exit(1)
+
+# Test custom config
+custom_config = Config(
+    max_output_bytes=65536, max_str_len=4096, log_to_cloud=True, license_key="test-key"
+)
+
+if custom_config.max_output_bytes != 65536:
+    sys.exit(1)
+
+if custom_config.license_key != "test-key":
+    sys.exit(1)
+
+print("✅ Library configuration working")
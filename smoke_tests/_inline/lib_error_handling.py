@@ -0,0 +1,28 @@
+"""Check that invalid input raises ValidationError."""
+
+import sys
+
+from agent_validator import Schema, ValidationError, ValidationMode, validate
+
+schema = Schema({"name": str, "age": int})
+
+# Test with missing required field
+test_data = {"name": "John"}
+
+try:
+    validate(test_data, schema, mode=ValidationMode.STRICT)
+    sys.exit(1)  # Should have failed
+except ValidationError as e:
+    if "age" not in str(e):
+        sys.exit(1)  # Error message should mention missing field
+
+# Test with wrong type
+test_data = {"name": "John", "age": "not_a_number"}
+
+try:
+    validate(test_data, schema, mode=ValidationMode.STRICT)
+    sys.exit(1)  # Should have failed
+except ValidationError:
+    pass  # Expected
+
+print("✅ Error handling working")
@@ -0,0 +1,26 @@
+"""Check the public imports and a basic validation."""
+
+import sys
+
+from agent_validator import (  # noqa: F401
+    CloudLogError,
+    Config,
+    Schema,
+    SchemaError,
+    ValidationError,
+    ValidationMode,
+    validate,
+)
+
+# Test basic schema creation
+schema = Schema({"name": str, "age": int, "email": str})
+
+# Test basic validation
+test_data = {"name": "John", "age": 30, "email": "john@example.com"}
+
+result = validate(test_data, schema, mode=ValidationMode.STRICT)
+
+if result["name"] != "John" or result["age"] != 30:
+    sys.exit(1)
+
+print("✅ All library functionality working")
@@ -0,0 +1,43 @@
+"""Check that validations are written to and read back from the local logs."""
+
+import sys
+
+from agent_validator import Schema, ValidationMode, validate
+from agent_validator.logging_ import clear_logs, get_recent_logs
+
+schema = Schema({"name": str, "age": int})
+
+# Clear existing logs
+clear_logs()
+
+# Perform a validation
+result = validate(
+    {"name": "John", "age": 30},
+    schema,
+    mode=ValidationMode.STRICT,
+    context={"test": True},
+)
+
+# Check that logs were created
+logs = get_recent_logs(10)
+
+if not logs:
+    sys.exit(1)
+
+# Find our test log
+test_log = None
+for log in logs:
+    if log.get("context", {}).get("test"):
+        test_log = log
+        break
+
+if not test_log:
+    sys.exit(1)
+
+if not test_log.get("valid"):
+    sys.exit(1)
+
+if "John" not in test_log.get("output_sample", ""):
+    sys.exit(1)
+
+print("✅ Logging functionality working")
@@ -0,0 +1,38 @@
+"""Check that validate retries through retry_fn."""
+
+import sys
+
+from agent_validator import Schema, ValidationMode, validate
+
+schema = Schema({"name": str, "age": int})
+
+# Mock retry function that fails first, then succeeds
+call_count = 0
+
+
+def mock_retry_fn(prompt: str, context: dict) -> str:
+    global call_count
+    call_count += 1
+
+    if call_count == 1:
+        return '{"name": "John", "age": "invalid"}'  # Invalid
+    else:
+        return '{"name": "John", "age": 30}'  # Valid
+
+
+# Test with retries
+result = validate(
+    '{"name": "John", "age": "invalid"}',
+    schema,
+    retry_fn=mock_retry_fn,
+    retries=2,
+    mode=ValidationMode.STRICT,
+)
+
+if call_count != 2:
+    sys.exit(1)
+
+if result["name"] != "John" or result["age"] != 30:
+    sys.exit(1)
+
+print("✅ Retry logic working")
@@ -0,0 +1,30 @@
+"""Check strict and coerce validation modes."""
+
+import sys
+
+from agent_validator import Schema, ValidationError, ValidationMode, validate
+
+schema = Schema({"age": int, "is_active": bool, "score": float})
+
+# Test strict mode (should fail)
+test_data = {"age": "30", "is_active": "true", "score": "42.5"}
+
+try:
+    validate(test_data, schema, mode=ValidationMode.STRICT)
+    sys.exit(1)  # Should have failed
+except ValidationError:
+    pass  # Expected
+
+# Test coerce mode (should succeed)
+result = validate(test_data, schema, mode=ValidationMode.COERCE)
+
+if not isinstance(result["age"], int) or result["age"] != 30:
+    sys.exit(1)
+
+if not isinstance(result["is_active"], bool) or result["is_active"] is not True:
+    sys.exit(1)
+
+if not isinstance(result["score"], float) or result["score"] != 42.5:
+    sys.exit(1)
+
+print("✅ Validation modes working")
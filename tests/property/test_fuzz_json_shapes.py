@@ -1,204 +1,175 @@
 """Property-based fuzzing tests for JSON shapes."""
 
-import random
+import os
 from typing import Any
 
 import pytest
-from hypothesis import given
+from hypothesis import assume, given, settings
 from hypothesis import strategies as st
 
 from agent_validator import Schema, ValidationError, ValidationMode, validate
 
-
-def generate_random_schema(depth: int = 0, max_depth: int = 3) -> dict[str, Any]:
-    """Generate a random schema for testing."""
-    if depth >= max_depth:
-        return {"value": random.choice([str, int, float, bool])}
-
-    schema = {}
-    num_fields = random.randint(1, 5)
-
-    for i in range(num_fields):
-        field_name = f"field_{i}"
-        field_type = random.choice(
-            [str, int, float, bool, list, dict, None]  # None for optional
-        )
-
-        if field_type is list:
-            # List with random element type
-            element_type = random.choice([str, int, float, bool, dict])
-            if element_type is dict:
-                schema[field_name] = [generate_random_schema(depth + 1, max_depth)]
-            else:
-                schema[field_name] = [element_type]
-        elif field_type is dict:
-            schema[field_name] = generate_random_schema(depth + 1, max_depth)
-        else:
-            schema[field_name] = field_type
-
-    return schema
-
-
-def generate_data_for_schema(
-    schema: dict[str, Any], depth: int = 0, max_depth: int = 3
+# Exceeds the default string length limit (8192); built once per module
+_OVERSIZED = "x" * 10000
+
+# The properties run as a quick check by default; set
+# SMOKE_HYPOTHESIS_EXAMPLES for a deeper search. Example generation time
+# varies with schema depth, so there is no per-example deadline
+_PROPERTY_SETTINGS = settings(
+    max_examples=int(os.getenv("SMOKE_HYPOTHESIS_EXAMPLES", "25")),
+    deadline=None,
+)
+
+_FIELD_NAMES = st.integers(min_value=0, max_value=9).map("field_{}".format)
+_PRIMITIVE_TYPES = st.sampled_from([str, int, float, bool])
+
+# Values of each primitive type, small enough to stay clear of the size limits
+_VALID_VALUES = {
+    str: st.text(max_size=20),
+    int: st.integers(min_value=-(10**12), max_value=10**12),
+    float: st.floats(allow_nan=False, allow_infinity=False),
+    bool: st.booleans(),
+}
+
+# Strings that COERCE mode converts to each primitive type
+_COERCIBLE_VALUES = {
+    str: st.text(max_size=20),
+    int: _VALID_VALUES[int].map(str),
+    float: _VALID_VALUES[float].map(repr),
+    bool: st.sampled_from(["true", "false", "1", "0"]),
+}
+
+# Values of the wrong type for each primitive type in STRICT mode
+_WRONG_VALUES = {
+    str: st.integers(),
+    int: st.text(max_size=20),
+    float: st.text(max_size=20),
+    bool: st.text(max_size=20),
+}
+
+
+def _object_schemas(fields: st.SearchStrategy) -> st.SearchStrategy:
+    """Build object schemas with one to five fields drawn from ``fields``."""
+    return st.dictionaries(_FIELD_NAMES, fields, min_size=1, max_size=5)
+
+
+def _extend_schemas(objects: st.SearchStrategy) -> st.SearchStrategy:
+    """Allow nested objects, and lists of them, as field types."""
+    return _object_schemas(
+        _PRIMITIVE_TYPES
+        | st.none()  # None for optional
+        | objects
+        | st.lists(_PRIMITIVE_TYPES | objects, min_size=1, max_size=1)
+    )
+
+
+schema_st = st.recursive(
+    _object_schemas(
+        _PRIMITIVE_TYPES
+        | st.none()
+        | st.lists(_PRIMITIVE_TYPES, min_size=1, max_size=1)
+    ),
+    _extend_schemas,
+    max_leaves=20,
+)
+
+
+@st.composite
+def data_for(
+    draw: st.DrawFn,
+    schema: dict[str, Any],
+    values: dict[type, st.SearchStrategy] = _VALID_VALUES,
 ) -> dict[str, Any]:
-    """Generate data that matches a schema."""
-    if depth >= max_depth:
-        return {"value": "test"}
-
+    """Generate data that matches a schema, drawing primitives from ``values``."""
     data = {}
 
     for field_name, field_type in schema.items():
         if field_type is None:
             # Optional field - randomly include or exclude
-            if random.choice([True, False]):
-                data[field_name] = "optional_value"
-        elif field_type is str:
-            data[field_name] = f"string_{random.randint(1, 100)}"
-        elif field_type is int:
-            data[field_name] = random.randint(1, 1000)
-        elif field_type is float:
-            data[field_name] = random.uniform(0, 1000)
-        elif field_type is bool:
-            data[field_name] = random.choice([True, False])
+            if draw(st.booleans()):
+                data[field_name] = draw(st.text(max_size=20))
+        elif isinstance(field_type, dict):
+            # Nested object
+            data[field_name] = draw(data_for(field_type, values))
         elif isinstance(field_type, list):
-            # List field
             element_type = field_type[0]
             if isinstance(element_type, dict):
-                # List of objects
-                data[field_name] = [
-                    generate_data_for_schema(element_type, depth + 1, max_depth)
-                    for _ in range(random.randint(1, 3))
-                ]
+                elements = data_for(element_type, values)
             else:
-                # List of primitives
-                if element_type is str:
-                    data[field_name] = [
-                        f"item_{i}" for i in range(random.randint(1, 3))
-                    ]
-                elif element_type is int:
-                    data[field_name] = [
-                        random.randint(1, 100) for _ in range(random.randint(1, 3))
-                    ]
-                elif element_type is float:
-                    data[field_name] = [
-                        random.uniform(0, 100) for _ in range(random.randint(1, 3))
-                    ]
-                elif element_type is bool:
-                    data[field_name] = [
-                        random.choice([True, False])
-                        for _ in range(random.randint(1, 3))
-                    ]
-        elif isinstance(field_type, dict):
-            # Nested object
-            data[field_name] = generate_data_for_schema(
-                field_type, depth + 1, max_depth
-            )
+                elements = values[element_type]
+            data[field_name] = draw(st.lists(elements, min_size=1, max_size=3))
+        else:
+            data[field_name] = draw(values[field_type])
 
     return data
 
 
-def generate_invalid_data_for_schema(
-    schema: dict[str, Any], depth: int = 0, max_depth: int = 3
-) -> dict[str, Any]:
+@st.composite
+def invalid_data_for(draw: st.DrawFn, schema: dict[str, Any]) -> dict[str, Any]:
     """Generate data that doesn't match a schema."""
-    if depth >= max_depth:
-        return {"value": 123}  # Wrong type
-
     data = {}
 
     for field_name, field_type in schema.items():
         if field_type is None:
-            # Optional field - include with wrong type
+            # Optional fields accept any value
             data[field_name] = 123
-        elif field_type is str:
-            data[field_name] = random.randint(1, 1000)  # Wrong type
-        elif field_type is int:
-            data[field_name] = "wrong_type"  # Wrong type
-        elif field_type is float:
-            data[field_name] = "wrong_type"  # Wrong type
-        elif field_type is bool:
-            data[field_name] = "wrong_type"  # Wrong type
+        elif isinstance(field_type, dict):
+            # Nested object - give wrong type
+            data[field_name] = "not_an_object"
         elif isinstance(field_type, list):
-            # List field with wrong element type
             element_type = field_type[0]
             if isinstance(element_type, dict):
                 # List of objects - give wrong type
                 data[field_name] = "not_a_list"
             else:
                 # List of primitives - give wrong element type
-                if element_type is str:
-                    data[field_name] = [123, 456]  # Wrong element type
-                elif element_type is int:
-                    data[field_name] = ["wrong", "types"]  # Wrong element type
-                elif element_type is float:
-                    data[field_name] = ["wrong", "types"]  # Wrong element type
-                elif element_type is bool:
-                    data[field_name] = ["wrong", "types"]  # Wrong element type
-        elif isinstance(field_type, dict):
-            # Nested object - give wrong type
-            data[field_name] = "not_an_object"
+                data[field_name] = draw(
+                    st.lists(_WRONG_VALUES[element_type], min_size=1, max_size=3)
+                )
+        else:
+            data[field_name] = draw(_WRONG_VALUES[field_type])
 
     return data
 
 
-@given(st.integers(min_value=1, max_value=3))
-def test_schema_validation_accepts_valid_data(max_depth):
+@_PROPERTY_SETTINGS
+@given(schema_dict=schema_st, data=st.data())
+def test_schema_validation_accepts_valid_data(schema_dict, data):
     """Test that schemas accept valid data."""
-    schema_dict = generate_random_schema(max_depth=max_depth)
     schema = Schema(schema_dict)
 
     # Generate valid data
-    valid_data = generate_data_for_schema(schema_dict, max_depth=max_depth)
+    valid_data = data.draw(data_for(schema_dict))
 
     # Should validate successfully
     result = validate(valid_data, schema, mode=ValidationMode.STRICT)
     assert result == valid_data
 
 
-@given(st.integers(min_value=1, max_value=3))
-def test_schema_validation_rejects_invalid_data(max_depth):
+@_PROPERTY_SETTINGS
+@given(schema_dict=schema_st, data=st.data())
+def test_schema_validation_rejects_invalid_data(schema_dict, data):
     """Test that schemas reject invalid data."""
-    schema_dict = generate_random_schema(max_depth=max_depth)
+    # A schema of only optional fields accepts anything
+    assume(any(field_type is not None for field_type in schema_dict.values()))
     schema = Schema(schema_dict)
 
     # Generate invalid data
-    invalid_data = generate_invalid_data_for_schema(schema_dict, max_depth=max_depth)
+    invalid_data = data.draw(invalid_data_for(schema_dict))
 
     # Should fail validation
     with pytest.raises(ValidationError):
         validate(invalid_data, schema, mode=ValidationMode.STRICT)
 
 
-@given(st.integers(min_value=1, max_value=3))
-def test_coercion_mode_accepts_coercible_data(max_depth):
+@_PROPERTY_SETTINGS
+@given(schema_dict=schema_st, data=st.data())
+def test_coercion_mode_accepts_coercible_data(schema_dict, data):
     """Test that coercion mode accepts data that can be coerced."""
-    schema_dict = generate_random_schema(max_depth=max_depth)
     schema = Schema(schema_dict)
 
     # Generate data with string numbers/booleans that can be coerced
-    coercible_data = {}
-    for field_name, field_type in schema_dict.items():
-        if field_type is int:
-            coercible_data[field_name] = str(random.randint(1, 1000))
-        elif field_type is float:
-            coercible_data[field_name] = str(random.uniform(0, 1000))
-        elif field_type is bool:
-            coercible_data[field_name] = random.choice(["true", "false", "1", "0"])
-        elif field_type is str:
-            coercible_data[field_name] = f"string_{random.randint(1, 100)}"
-        elif isinstance(field_type, list):
-            element_type = field_type[0]
-            if element_type is int:
-                coercible_data[field_name] = [
-                    str(random.randint(1, 100)) for _ in range(3)
-                ]
-            elif element_type is str:
-                coercible_data[field_name] = [f"item_{i}" for i in range(3)]
-        elif isinstance(field_type, dict):
-            coercible_data[field_name] = generate_data_for_schema(
-                field_type, max_depth=max_depth
-            )
+    coercible_data = data.draw(data_for(schema_dict, _COERCIBLE_VALUES))
 
     # Should validate successfully with coercion
     result = validate(coercible_data, schema, mode=ValidationMode.COERCE)
@@ -213,9 +184,10 @@ def test_coercion_mode_accepts_coercible_data(max_depth):
             assert isinstance(result[field_name], bool)
 
 
-def test_schema_serialization():
+@_PROPERTY_SETTINGS
+@given(schema_dict=schema_st)
+def test_schema_serialization(schema_dict):
     """Test that schemas can be serialized and deserialized."""
-    schema_dict = generate_random_schema(max_depth=2)
     original_schema = Schema(schema_dict)
 
     # Serialize to dict
@@ -228,9 +200,10 @@ def test_schema_serialization():
     assert deserialized_schema.schema_dict == original_schema.schema_dict
 
 
-def test_schema_json_serialization():
+@_PROPERTY_SETTINGS
+@given(schema_dict=schema_st)
+def test_schema_json_serialization(schema_dict):
     """Test that schemas can be serialized to JSON and back."""
-    schema_dict = generate_random_schema(max_depth=2)
     original_schema = Schema(schema_dict)
 
     # Serialize to JSON
@@ -248,8 +221,7 @@ def test_size_limits_enforced():
     # Create a schema with a string field
     schema = Schema({"data": str})
 
-    # Create data that exceeds the default string length limit (8192)
-    oversized_data = {"data": "x" * 10000}
+    oversized_data = {"data": _OVERSIZED}
 
     # Should fail validation
     with pytest.raises(ValidationError, match="size_limit"):
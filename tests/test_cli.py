@@ -1,5 +1,6 @@
 """Tests for CLI functionality."""
 
+import io
 import json
 import sys
 import tempfile
@@ -65,6 +66,49 @@ def test_test_command_success(runner, temp_schema_file, temp_input_file):
     assert "✓ Validation successful" in result.stdout
 
 
+def test_schema_cache_tracks_file_changes(tmp_path, monkeypatch):
+    """Test that cached schemas are reused until the schema file changes."""
+    from cli.main import _schema_cache_file, load_schema_file
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"schema": {"name": "string"}}))
+
+    first = load_schema_file(str(schema_file))
+    assert first.schema_dict == {"name": str}
+    assert _schema_cache_file(str(schema_file)).exists()
+    assert load_schema_file(str(schema_file)).schema_dict == {"name": str}
+
+    schema_file.write_text(json.dumps({"name": "string", "age": "integer"}))
+    assert load_schema_file(str(schema_file)).schema_dict == {
+        "name": str,
+        "age": int,
+    }
+
+
+def test_schema_cache_ignores_stale_and_corrupt_entries(tmp_path, monkeypatch):
+    """Test that cache entries from other releases or bad pickles are rebuilt."""
+    import os
+    import pickle
+
+    from agent_validator import Schema
+    from cli.main import _schema_cache_file, load_schema_file
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"name": "string"}))
+    cache_file = _schema_cache_file(str(schema_file))
+    cache_file.parent.mkdir(parents=True)
+
+    stat = os.stat(schema_file)
+    old_signature = ("0.0.0", pickle.HIGHEST_PROTOCOL, stat.st_mtime_ns, stat.st_size)
+    cache_file.write_bytes(pickle.dumps((old_signature, Schema({"stale": int}))))
+    assert load_schema_file(str(schema_file)).schema_dict == {"name": str}
+
+    cache_file.write_bytes(b"not a pickle")
+    assert load_schema_file(str(schema_file)).schema_dict == {"name": str}
+
+
 def test_test_command_failure(runner, temp_schema_file):
     """Test the test command with invalid input."""
     # Create invalid input file
@@ -174,6 +218,91 @@ def test_logs_command_with_number(mock_get_logs, runner):
     mock_get_logs.assert_called_once_with(10)
 
 
+@patch("cli.main.app")
+@patch("cli.main.get_recent_logs")
+@patch("cli.main.create_default_config")
+def test_main_fast_dispatch(mock_create_config, mock_get_logs, mock_app, capsys):
+    """Test that simple id/logs invocations skip the Typer app."""
+    from cli.main import main
+
+    mock_get_logs.return_value = []
+
+    with patch.object(sys, "argv", ["agent-validator", "id"]):
+        main()
+    assert uuid.UUID(capsys.readouterr().out.strip())
+    mock_create_config.assert_not_called()
+
+    with patch.object(sys, "argv", ["agent-validator", "logs", "-n", "5"]):
+        main()
+    mock_get_logs.assert_called_once_with(5)
+    assert "No logs found." in capsys.readouterr().out
+    mock_create_config.assert_called_once()
+    mock_app.assert_not_called()
+
+    # Anything else goes through Typer
+    with patch.object(sys, "argv", ["agent-validator", "logs", "--clear"]):
+        main()
+    mock_app.assert_called_once()
+
+
+@patch("cli.main.create_default_config")
+def test_main_serve_stdio(mock_create_config, capsys):
+    """Test that --serve-stdio answers one JSON reply per request."""
+    from cli.main import main
+
+    requests = io.StringIO(
+        json.dumps({"args": ["id"]})
+        + "\n"
+        + json.dumps({"args": ["test", "missing.json", "missing.json"]})
+        + "\n"
+    )
+    with patch.object(sys, "argv", ["agent-validator", "--serve-stdio"]):
+        with patch.object(sys, "stdin", requests):
+            main()
+
+    replies = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(replies) == 2
+    assert replies[0]["rc"] == 0
+    assert uuid.UUID(replies[0]["stdout"].strip())
+    assert replies[1]["rc"] == 2
+    assert "Validation failed" in replies[1]["stderr"]
+
+
+@patch("cli.main.get_config")
+@patch("cli.main.create_default_config")
+def test_main_serve_stdio_survives_bad_requests(
+    mock_create_config, mock_get_config, capsys
+):
+    """Test that bad requests and stdin-reading commands don't stop the server."""
+    from agent_validator.typing_ import Config
+    from cli.main import main
+
+    mock_get_config.return_value = Config()
+    requests = io.StringIO(
+        "not json\n"
+        + json.dumps({"argv": ["id"]})
+        + "\n"
+        + json.dumps(["id"])
+        + "\n"
+        + json.dumps({"args": "id"})
+        + "\n"
+        + json.dumps({"args": ["config", "--batch", "-"]})
+        + "\n"
+        + json.dumps({"args": ["id"]})
+        + "\n"
+    )
+    with patch.object(sys, "argv", ["agent-validator", "--serve-stdio"]):
+        with patch.object(sys, "stdin", requests):
+            main()
+            assert sys.stdin is requests
+
+    replies = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [reply["rc"] for reply in replies] == [2, 2, 2, 2, 1, 0]
+    assert all("Invalid request" in reply["stderr"] for reply in replies[:4])
+    assert "Invalid config batch" in replies[4]["stderr"]
+    assert uuid.UUID(replies[5]["stdout"].strip())
+
+
 @patch("cli.main.clear_logs")
 def test_logs_command_clear(mock_clear_logs, runner):
     """Test the logs command with clear flag."""
@@ -254,6 +383,76 @@ def test_config_command_set_log_to_cloud(mock_save_config, mock_get_config, runn
     mock_save_config.assert_called_once_with(config)
 
 
+@patch("cli.main.get_config")
+@patch("cli.main.save_config")
+def test_config_command_batch(mock_save_config, mock_get_config, runner):
+    """Test running several config operations in one invocation."""
+    from agent_validator.typing_ import Config
+
+    config = Config()
+    mock_get_config.return_value = config
+
+    operations = [
+        {"op": "show"},
+        {"op": "set-license-key", "value": "test-key"},
+        {"op": "show"},
+        {"op": "show", "show_secrets": True},
+    ]
+    result = runner.invoke(app, ["config", "--batch", json.dumps(operations)])
+
+    assert result.exit_code == 0
+    outputs = json.loads(result.stdout)
+    assert len(outputs) == 4
+    assert "license_key: not set" in outputs[0]
+    assert outputs[1] == "License key updated."
+    assert "license_key: ***" in outputs[2]
+    assert "license_key: test-key" in outputs[3]
+    mock_save_config.assert_called_once_with(config)
+
+    result = runner.invoke(app, ["config", "--batch", '[{"op": "bogus"}]'])
+    assert result.exit_code == 1
+
+
+@patch("cli.main.get_config")
+@patch("cli.main.save_config")
+def test_config_command_batch_rejects_malformed_operations(
+    mock_save_config, mock_get_config, runner
+):
+    """Test that invalid batch documents fail cleanly without saving."""
+    from agent_validator.typing_ import Config
+
+    config = Config()
+    mock_get_config.return_value = config
+
+    for document in [
+        "not json",
+        '{"op": "show"}',
+        "[1]",
+        '[{"op": "bogus"}]',
+        '[{"op": "set-license-key"}]',
+        '[{"op": "set-license-key", "value": 123}]',
+        '[{"op": "set-endpoint", "value": null}]',
+        '[{"op": "set-log-to-cloud", "value": "false"}]',
+        '[{"op": "show", "show_secrets": "no"}]',
+        '[{"op": "set-license-key", "value": "ok"}, {"op": "set-log-to-cloud"}]',
+    ]:
+        result = runner.invoke(app, ["config", "--batch", document])
+        assert result.exit_code == 1, document
+        assert "Invalid config batch" in result.stderr, document
+        assert result.exception is None or isinstance(result.exception, SystemExit)
+
+    mock_save_config.assert_not_called()
+    assert config.license_key is None
+    assert config.log_to_cloud is False
+
+    result = runner.invoke(
+        app, ["config", "--batch", '[{"op": "set-log-to-cloud", "value": false}]']
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == ["Cloud logging disabled."]
+    assert config.log_to_cloud is False
+
+
 def test_help_command(runner):
     """Test the help command."""
     result = runner.invoke(app, ["--help"])
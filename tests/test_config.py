@@ -0,0 +1,29 @@
+"""Tests for configuration loading."""
+
+from agent_validator.config import get_config, save_config
+
+
+def test_config_file_changes_are_picked_up(tmp_path, monkeypatch):
+    """Test that cached config file contents are refreshed after a save."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("AGENT_VALIDATOR_ENDPOINT", raising=False)
+    monkeypatch.delenv("AGENT_VALIDATOR_RETRIES", raising=False)
+
+    config = get_config()
+    config.cloud_endpoint = "https://first.example.com"
+    save_config(config)
+    assert get_config().cloud_endpoint == "https://first.example.com"
+
+    config.cloud_endpoint = "https://second.example.com"
+    config.retries = 5
+    save_config(config)
+    reloaded = get_config()
+    assert reloaded.cloud_endpoint == "https://second.example.com"
+    assert reloaded.retries == 5
+
+    # Callers get independent objects, so mutations don't leak into the cache
+    reloaded.retries = 0
+    assert get_config().retries == 5
+
+    monkeypatch.setenv("AGENT_VALIDATOR_RETRIES", "7")
+    assert get_config().retries == 7
@@ -0,0 +1,46 @@
+"""Tests for validation result logging."""
+
+from agent_validator import Config, logging_
+
+
+def test_cloud_logs_share_one_session(tmp_path, monkeypatch):
+    """Test that cloud log requests reuse a single HTTP session."""
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+    class FakeSession:
+        def __init__(self):
+            self.urls = []
+
+        def post(self, url, **kwargs):
+            self.urls.append(url)
+            return FakeResponse()
+
+    assert logging_._get_session() is logging_._get_session()
+
+    session = FakeSession()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(logging_, "_get_session", lambda: session)
+    config = Config(
+        log_to_cloud=True,
+        license_key="test-key",
+        cloud_endpoint="https://cloud.example.com",
+    )
+
+    for _ in range(2):
+        logging_.log_validation_result(
+            correlation_id=None,
+            valid=True,
+            errors=[],
+            attempts=1,
+            duration_ms=1,
+            mode="strict",
+            context={},
+            output_sample='{"name": "John"}',
+            log_to_cloud=True,
+            config=config,
+        )
+
+    assert session.urls == ["https://cloud.example.com/logs"] * 2
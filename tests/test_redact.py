@@ -208,3 +208,145 @@ def test_mixed_data_types():
     assert redacted["list"][0] != "alice@example.com"
     assert redacted["list"][1] != "bob@example.com"
     assert redacted["dict"]["email"] != "charlie@example.com"
+
+
+def _clear_compiled_pattern_caches():
+    from agent_validator import redact
+
+    redact._default_compiled_patterns.cache_clear()
+    redact._default_redactor.cache_clear()
+    redact._assignment_prefilter.cache_clear()
+
+
+def test_redaction_without_re2(monkeypatch):
+    """Test redaction falls back to the stdlib re engine."""
+    import re
+
+    from agent_validator import redact
+
+    _clear_compiled_pattern_caches()
+    monkeypatch.setattr(redact, "re2", None)
+    try:
+        redactor = Redactor()
+        assert isinstance(redactor.compiled_patterns["email"], re.Pattern)
+
+        text = (
+            "My license key is license-1234567890abcdef "
+            "and my email is john@example.com"
+        )
+        redacted = redactor.redact_text(text)
+
+        assert "license-1234567890abcdef" not in redacted
+        assert "j***n@example.com" in redacted
+    finally:
+        monkeypatch.undo()
+        _clear_compiled_pattern_caches()
+
+
+def test_unicode_whitespace_and_digits_are_redacted():
+    """Test that whitespace and digits outside RE2's ASCII classes still match."""
+    redactor = Redactor()
+
+    for text in [
+        "secret:\xa0" + "abcdefghijklmnopqrstuvwxyz",
+        "password\x0b= hunter2",
+        "Token:\u3000aaa.bbb.ccc",
+        "phone:\xa0555 123 4567",
+    ]:
+        assert redactor.redact_text(text) == "[REDACTED]", repr(text)
+
+    # Arabic-Indic digits
+    card = "\u0664\u0661\u0661\u0661 " * 3 + "\u0661\u0662\u0663\u0664"
+    assert redactor.redact_text(f"card {card} on file") == (
+        "card " + "*" * 12 + "\u0661\u0662\u0663\u0664 on file"
+    )
+
+
+def test_redactors_share_compiled_default_patterns():
+    """Test default patterns are compiled once and not mutated per instance."""
+    first = Redactor()
+    second = Redactor({"custom_ref": r"ref-[0-9]{6,}"})
+
+    assert first.compiled_patterns["email"] is second.compiled_patterns["email"]
+    assert "custom_ref" not in first.compiled_patterns
+    assert "custom_ref" not in Redactor().compiled_patterns
+
+
+def test_redaction_does_not_mutate_input():
+    """Test redaction returns copies and leaves the input untouched."""
+    data = {"users": [{"email": "alice@example.com", "age": 30}]}
+
+    redacted = redact_sensitive_data(data)
+
+    assert data == {"users": [{"email": "alice@example.com", "age": 30}]}
+    assert redacted["users"][0]["email"] != "alice@example.com"
+    assert redacted["users"][0]["age"] == 30
+
+
+def test_license_value_redaction_inline():
+    """Test license values are redacted wherever they appear in text."""
+    redactor = Redactor()
+
+    text = "keys: License-abc_123, license- and license-XYZ-789."
+    redacted = redactor.redact_text(text)
+
+    assert redacted == "keys: [REDACTED], license- and [REDACTED]."
+
+
+def test_license_value_redaction_non_ascii():
+    """Test license values with characters that fold to ASCII letters."""
+    redactor = Redactor()
+
+    # KELVIN SIGN and LATIN SMALL LETTER LONG S match "k" and "s"
+    assert redactor.redact_text("license-\u212a") == "[REDACTED]"
+    assert redactor.redact_text("license-x\u212a") == "[REDACTED]"
+    assert redactor.redact_text("Licen\u017fe-abc é") == "[REDACTED] é"
+
+
+def test_redaction_gates_respect_custom_overrides():
+    """Test that overriding a default pattern also drops its trigger gate."""
+    redactor = Redactor({"secret": r"hunter\d"})
+    assert redactor.redact_text("pass is hunter2") == "pass is [REDACTED]"
+    assert Redactor().redact_text("plain text, nothing here") == (
+        "plain text, nothing here"
+    )
+
+
+def test_trigger_gate_skipped_for_non_ascii_text(monkeypatch):
+    """Test that case-insensitive matches beyond ASCII aren't gated out."""
+    from agent_validator import redact
+
+    _clear_compiled_pattern_caches()
+    monkeypatch.setattr(redact, "re2", None)
+    try:
+        assert Redactor().redact_text("mob\u0130le: 5551234567890") == "[REDACTED]"
+    finally:
+        monkeypatch.undo()
+        _clear_compiled_pattern_caches()
+
+    assert Redactor().redact_text("mob\u0130le: 5551234567890") == "[REDACTED]"
+
+
+def test_assignment_patterns_need_separator():
+    """Test that keyword mentions without an assignment are left alone."""
+    redactor = Redactor()
+    assert redactor.redact_text("the secret key is the phone") == (
+        "the secret key is the phone"
+    )
+    assert redactor.redact_text("note\npwd = hunter2") == "note\n[REDACTED]"
+
+
+def test_hyperscan_prefilter_matches_fallback(monkeypatch):
+    """Test the Hyperscan prefilter doesn't change redaction output."""
+    from agent_validator import redact
+
+    texts = [
+        "contact jane.doe@example.com or call 555-123-4567",
+        "password:\x1csecret and ssn 123-45-6789",
+        "Bearer abc.def.ghi",
+        "nothing sensitive in this line",
+    ]
+    expected = [Redactor().redact_text(text) for text in texts]
+
+    monkeypatch.setattr(redact, "_hyperscan_database", lambda: None)
+    assert [Redactor().redact_text(text) for text in texts] == expected
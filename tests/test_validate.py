@@ -5,6 +5,7 @@ import json
 import pytest
 
 from agent_validator import (
+    Config,
     Schema,
     SchemaError,
     ValidationError,
@@ -154,6 +155,12 @@ def test_schema_validation():
     with pytest.raises(SchemaError):
         Schema({"items": [str, int]})  # List with multiple elements
 
+    # Invalid nested schemas
+    with pytest.raises(SchemaError, match="Unsupported type"):
+        Schema({"user": {"profile": {"avatar": bytes}}})
+    with pytest.raises(SchemaError, match="Unsupported type"):
+        Schema({"users": [{"name": bytes}]})
+
 
 def test_boolean_coercion():
     """Test boolean coercion."""
@@ -185,3 +192,127 @@ def test_number_coercion():
 
     assert result["age"] == 30
     assert result["score"] == 95.5
+
+
+def test_nested_list_error_path():
+    """Test that errors inside lists of nested schemas report the full path."""
+    schema = Schema({"users": [{"name": str, "tags": [str]}]})
+    data = {"users": [{"name": "a", "tags": ["x"]}, {"name": "b", "tags": [1]}]}
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate(data, schema)
+    assert exc_info.value.path == "root.users[1].tags[0]"
+
+
+def test_size_limit_on_string_input():
+    """Test that string inputs are size-checked on their raw bytes."""
+    schema = Schema({"name": str})
+    config = Config(max_output_bytes=32)
+
+    assert validate('{"name": "short"}', schema, config=config) == {"name": "short"}
+    with pytest.raises(ValidationError, match="size_limit"):
+        validate('{"name": "' + "é" * 12 + '"}', schema, config=config)
+
+
+def test_validation_without_orjson(monkeypatch):
+    """Test that validation falls back to the stdlib JSON module."""
+    from agent_validator import json_
+
+    monkeypatch.setattr(json_, "orjson", None)
+    schema = Schema({"name": str, "score": float})
+
+    result = validate('{"name": "Zoë", "score": NaN}', schema)
+    assert result["name"] == "Zoë"
+    assert Schema.from_json(schema.to_json()).schema_dict == schema.schema_dict
+
+
+def test_large_integers_keep_precision():
+    """Test that integers beyond 64 bits are parsed as exact ints."""
+    schema = Schema({"id": int})
+
+    result = validate('{"id": 18446744073709551616}', schema)
+    assert result == {"id": 18446744073709551616}
+
+
+def test_output_size_is_the_same_without_orjson(monkeypatch):
+    """Test that dict outputs are sized identically by both JSON backends."""
+    from datetime import datetime
+
+    from agent_validator import json_
+
+    output = {"name": "Zoë", "tags": ["a", "b"], "score": float("nan"), "x": None}
+    expected = json_.dumpb(output)
+    assert expected == '{"name":"Zoë","tags":["a","b"],"score":NaN,"x":null}'.encode()
+    floats = [1e16, -2.5e20, 1e-5, 1e-7, 5e-324, 0.0001, 1e15, -0.0, 0.1]
+    expected_floats = json_.dumpb({"floats": floats})
+    assert expected_floats == (
+        b'{"floats":[1e+16,-2.5e+20,1e-05,1e-07,5e-324,0.0001,'
+        b"1000000000000000.0,-0.0,0.1]}"
+    )
+    with pytest.raises(TypeError):
+        json_.dumpb({"at": datetime(2024, 1, 1)})
+
+    monkeypatch.setattr(json_, "orjson", None)
+    assert json_.dumpb(output) == expected
+    assert json_.dumpb({"floats": floats}) == expected_floats
+    with pytest.raises(TypeError):
+        json_.dumpb({"at": datetime(2024, 1, 1)})
+
+    schema = Schema({"name": str})
+    config = Config(max_output_bytes=16)
+    assert validate({"name": "Zoë"}, schema, config=config) == {"name": "Zoë"}
+    with pytest.raises(ValidationError, match="size_limit"):
+        validate({"name": "Zoë Z"}, schema, config=config)
+
+
+def test_null_output_stays_on_orjson(monkeypatch):
+    """Test that outputs with null values aren't re-encoded by the stdlib."""
+    from agent_validator import json_
+
+    if json_.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("stdlib encoder used")
+
+    monkeypatch.setattr(json_.json, "dumps", fail)
+    assert json_.dumpb({"a": None, "b": "nullable", "c": [1.5]}) == (
+        b'{"a":null,"b":"nullable","c":[1.5]}'
+    )
+
+
+def test_schema_json_round_trip_without_top_level_types():
+    """Test that nested type names are restored when no top-level field has one."""
+    schema_dict = {"user": {"name": str, "tags": [str]}, "items": [{"id": int}]}
+    schema = Schema(schema_dict)
+
+    assert Schema.from_json(schema.to_json()).schema_dict == schema_dict
+
+
+def test_oversized_string_rejected_before_parsing(monkeypatch):
+    """Test that oversized string inputs fail before they are parsed."""
+    from agent_validator import json_
+
+    def fail_loads(data):
+        raise AssertionError("oversized input should not be parsed")
+
+    monkeypatch.setattr(json_, "loads", fail_loads)
+    schema = Schema({"data": str})
+
+    with pytest.raises(ValidationError, match="size_limit"):
+        validate("x" * 200, schema, config=Config(max_output_bytes=100))
+
+
+def test_scalar_list_limits_and_paths():
+    """Test that scalar list items keep size limits and error paths."""
+    schema = Schema({"tags": [str], "ids": [int]})
+
+    with pytest.raises(ValidationError, match="size_limit"):
+        validate({"tags": ["ok", "x" * 10000], "ids": []}, schema)
+
+    with pytest.raises(ValidationError) as exc_info:
+        validate({"tags": [], "ids": [1, 2, "3"]}, schema)
+    assert exc_info.value.path == "root.ids[2]"
+
+    result = validate({"tags": [], "ids": [1, True]}, schema)
+    assert result["ids"] == [1, True]